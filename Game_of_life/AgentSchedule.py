@@ -0,0 +1,48 @@
+from itertools import chain
+from typing import Iterator
+
+from .Organism import Organism
+from .OrganismRegistry import OrganismRegistry
+from .Predator import Predator
+from .Prey import Prey
+
+
+# ======================= Colas de agentes por especie =======================
+class AgentSchedule:
+    """Una cola (OrganismRegistry) por especie móvil, en orden de turno.
+
+    update_organisms recorre primero todas las presas y luego todos los
+    depredadores, cada cola solo hasta la longitud que tenía al empezar su
+    fase: las crías se añaden al final y actúan a partir del ciclo siguiente,
+    igual que en el backend numpy (ArrayEcosystem.update_prey mueve solo las
+    presas que había antes de criar). Las plantas no tienen cola (van en el mapa
+    de bits) y los muertos se retiran en reap().
+    """
+
+    ORDER = (Prey, Predator)
+
+    def __init__(self):
+        self.queues = {cls: OrganismRegistry() for cls in self.ORDER}
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self.queues.values())
+
+    def __iter__(self) -> Iterator[Organism]:
+        return chain.from_iterable(self.queues.values())
+
+    def __contains__(self, organism: Organism) -> bool:
+        return organism in self.queues[type(organism)]
+
+    def append(self, organism: Organism):
+        self.queues[type(organism)].append(organism)
+
+    def remove(self, organism: Organism):
+        self.queues[type(organism)].remove(organism)
+
+    def compact(self):
+        for queue in self.queues.values():
+            queue.compact()
+
+    def slot_count(self) -> int:
+        # Huecos reservados, lápidas incluidas
+        return sum(len(queue.slots) for queue in self.queues.values())
@@ -0,0 +1,199 @@
+import sys
+
+import numpy as np
+
+from .Ecosystem import Ecosystem
+from .Neighbours import neighbour_index
+from .PreyField import STEPS, prey_field
+from .Species import EMPTY, PLANT, PREY, PREDATOR, SYMBOLS
+
+
+# ======================= Ecosistema vectorizado =======================
+class ArrayEcosystem(Ecosystem):
+    """Backend struct-of-arrays: cada fase del ciclo es una pasada vectorizada.
+
+    Las reglas son las de Plant/Prey/Predator, pero dentro de una fase todos
+    los agentes deciden sobre el mismo estado; si dos eligen la misma celda
+    gana el primero en orden de filas. Los recién nacidos actúan en el ciclo
+    siguiente.
+    """
+
+    def __init__(self, size: int, max_cycles: int, iterative: bool = False, *, backend: str = 'numpy',
+                 **options):
+        # synchronous se acepta sin efecto: cada fase ya decide sobre el mismo estado y resuelve colisiones
+        super().__init__(size, max_cycles, iterative, backend=backend, **options)
+
+    def configure(self, *args):
+        super().configure(*args)
+        self.max_starvation_time = self.max_cycles // 2
+        self.shared = None  # SharedWorld activo, ver share()
+
+    def create_rng(self, seed):
+        # Con un Generator devuelve ese mismo generador (TiledEcosystem sortea así su mundo inicial)
+        return np.random.default_rng(seed)
+
+    def create_neighbours(self, size: int, wrap: bool):
+        return neighbour_index(size, wrap)
+
+    def create_world(self):
+        shape = (self.size, self.size)
+        self.species = np.zeros(shape, dtype=np.int8)
+        self.health = np.zeros(shape, dtype=np.int16)
+        self.energy = np.zeros(shape, dtype=np.int32)
+        self.starvation_time = np.zeros(shape, dtype=np.int32)
+
+    def initialize_organisms(self):
+        total = self.size ** 2
+        self.place(PLANT, total // 3)
+        self.place(PREY, total // 5)
+        self.place(PREDATOR, total // 10)
+
+    def place(self, code: int, count: int):
+        empty = np.flatnonzero(self.species == EMPTY)
+        count = min(count, len(empty))
+        cells = self.rng.choice(empty, size=count, replace=False)
+        self.spawn(cells, code, energy=0)
+
+    def spawn(self, cells: np.ndarray, code: int, energy: int):
+        self.species.flat[cells] = code
+        self.health.flat[cells] = 100
+        self.energy.flat[cells] = energy
+        self.starvation_time.flat[cells] = 0
+        self.count_organisms()
+
+    def count_organisms(self):
+        counts = np.bincount(self.species.ravel(), minlength=4)
+        self.num_plants = int(counts[PLANT])
+        self.num_prey = int(counts[PREY])
+        self.num_predators = int(counts[PREDATOR])
+
+    def update_ecosystem(self):
+        # Sin métodos de mutación por celda, el recorder saca el delta de comparar con el ciclo anterior
+        previous = self.species.copy() if self.recorder is not None else None
+        if self.cycle_count % self.plant_regeneration_interval == 0 and self.cycle_count != 0:
+            self.place(PLANT, (self.size ** 2) // 6)
+            self.count_organisms()  # La condición de cría ve las plantas nuevas, como en Ecosystem
+        self.update_prey()
+        self.update_predators()
+        self.reap()
+        self.count_organisms()
+        self.cycle_count += 1
+        if previous is not None:
+            changed = np.flatnonzero(previous.ravel() != self.species.ravel())
+            self.recorder.cells(changed.tolist(), self.species.ravel()[changed].tobytes())
+            self.recorder.end_cycle(self)
+        if self.shared is not None:
+            self.shared.publish(self)
+        if self.detector is not None:
+            self.detector.end_cycle(self)
+
+    def reap(self):
+        # Los depredadores muertos de hambre dejan su celda libre
+        dead = (self.species == PREDATOR) & (self.health <= 0)
+        for array in (self.species, self.health, self.energy, self.starvation_time):
+            array[dead] = 0
+        self.reaped += int(np.count_nonzero(dead))
+
+    def layout_hash(self) -> int:
+        # Sin cambios por celda que seguir: hash de la cuadrícula entera, O(área) como el ciclo
+        return hash(self.species.tobytes())
+
+    def state_fingerprint(self) -> tuple:
+        arrays = (self.species, self.health, self.energy, self.starvation_time)
+        return (tuple(array.tobytes() for array in arrays),
+                self.cycle_count % self.plant_regeneration_interval, repr(self.rng.bit_generator.state))
+
+    def memory_gauges(self) -> dict:
+        arrays = (self.species, self.health, self.energy, self.starvation_time)
+        return {'array_bytes': sum(array.nbytes for array in arrays)}
+
+    def share(self, name: str = None) -> 'SharedWorld':
+        # Publica cada ciclo en memoria compartida para lectores de otros procesos
+        from .SharedWorld import SharedWorld
+        self.shared = SharedWorld(self, name)
+        return self.shared
+
+    def stop_sharing(self):
+        # Libera el segmento; los lectores que sigan enganchados conservan su copia del mapa
+        if self.shared is not None:
+            self.shared.close()
+            self.shared = None
+
+    def species_bytes(self) -> bytes:
+        return self.species.tobytes()
+
+    # ---------------------- Vecindad ----------------------
+    def first_adjacent(self, cells: np.ndarray, allowed: tuple) -> np.ndarray:
+        # Primera celda vecina válida en el orden de DIRECTIONS, -1 si no hay
+        target = np.full(len(cells), -1, dtype=np.int64)
+        for neighbour in self.neighbours:
+            candidate = neighbour[cells]
+            valid = (candidate >= 0) & np.isin(self.species.flat[candidate], allowed) & (target < 0)
+            target[valid] = candidate[valid]
+        return target
+
+    def resolve(self, sources: np.ndarray, targets: np.ndarray):
+        # Descarta agentes sin destino y, en colisiones, deja solo al primero
+        keep = targets >= 0
+        sources, targets = sources[keep], targets[keep]
+        _, first = np.unique(targets, return_index=True)
+        first.sort()
+        return sources[first], targets[first]
+
+    def relocate(self, sources: np.ndarray, targets: np.ndarray):
+        for array in (self.species, self.health, self.energy, self.starvation_time):
+            values = array.flat[sources]
+            array.flat[sources] = 0
+            array.flat[targets] = values
+
+    # ---------------------- Presas ----------------------
+    def update_prey(self):
+        prey = np.flatnonzero(self.species == PREY)  # Las crías de este ciclo no se mueven hasta el siguiente
+        if self.num_plants >= self.num_prey + 2:
+            _, births = self.resolve(prey, self.first_adjacent(prey, (EMPTY, PLANT)))
+            # Como en Prey.update_state, cada cría cuenta para la condición de la siguiente
+            self.spawn(births[:self.num_plants - self.num_prey - 1], PREY, energy=0)
+        sources, targets = self.resolve(prey, self.first_adjacent(prey, (EMPTY, PLANT)))
+        eats = self.species.flat[targets] == PLANT
+        self.energy.flat[sources[eats]] += 10
+        self.relocate(sources, targets)
+
+    # ---------------------- Depredadores ----------------------
+    def update_predators(self):
+        predators = np.flatnonzero((self.species == PREDATOR) & (self.health > 0))
+        self.starvation_time.flat[predators] += 1
+        starved = self.starvation_time.flat[predators] >= self.max_starvation_time
+        self.health.flat[predators[starved]] = 0
+
+        parents = predators[self.energy.flat[predators] >= 50]
+        parents, births = self.resolve(parents, self.first_adjacent(parents, (EMPTY,)))
+        self.spawn(births, PREDATOR, energy=10)
+        self.energy.flat[parents] = 0
+
+        targets = self.hunting_targets(predators)
+        wander = targets == -1
+        targets[wander] = self.first_adjacent(predators[wander], (EMPTY,))
+        sources, targets = self.resolve(predators, targets)
+        hunted = self.species.flat[targets] == PREY
+        self.relocate(sources, targets)
+        self.energy.flat[targets[hunted]] += 10
+        self.starvation_time.flat[targets[hunted]] = 0
+
+    def hunting_targets(self, predators: np.ndarray) -> np.ndarray:
+        # Un campo de direcciones por ciclo; cada depredador lee su celda en O(1)
+        codes = prey_field(self.species == PREY).flat[predators]
+        steps = STEPS[codes]
+        visible = codes >= 0
+        target = np.where(visible, predators + steps[:, 0] * self.size + steps[:, 1], -1)
+        reachable = np.isin(self.species.flat[np.where(visible, target, 0)], (EMPTY, PREY))
+        # Con presa a la vista pero bloqueado se queda quieto (-2 no vaga)
+        return np.where(visible, np.where(reachable, target, -2), -1)
+
+    # ---------------------- Salida ----------------------
+    def print_grid(self, row=0):
+        # Sin resaltado: TerminalRenderer guarda el cuadro anterior y marca los cambios
+        symbols = np.array(SYMBOLS)[self.species]
+        for x in range(row, self.size):
+            sys.stdout.write(' '.join(symbols[x]) + ' \n')
+        print(f"Plantas: {self.num_plants} | Presas: {self.num_prey} | Depredadores: {self.num_predators}")
+        print(f"Ciclo: {self.cycle_count}/{self.max_cycles}")
@@ -0,0 +1,89 @@
+import sys
+import time
+
+from .Ecosystem import Ecosystem
+from .ResultCache import ResultCache, entry
+
+
+# ======================= Ejecución sin terminal =======================
+def population_summary(eco: Ecosystem) -> str:
+    return summary_line(eco.cycle_count, eco.max_cycles, (eco.num_plants, eco.num_prey, eco.num_predators))
+
+
+def summary_line(cycle: int, max_cycles: int, counts) -> str:
+    plants, prey, predators = counts
+    return (f"Ciclo: {cycle}/{max_cycles} | Plantas: {plants} | "
+            f"Presas: {prey} | Depredadores: {predators}")
+
+
+def cached_batch(result: dict, max_cycles: int, report_every: int, out) -> dict:
+    # Mismos resúmenes que la ejecución original, sacados de la serie guardada
+    if report_every:
+        for cycle in range(report_every, len(result['series']), report_every):
+            out.write(summary_line(cycle, max_cycles, result['series'][cycle]) + "\n")
+    elapsed = result['elapsed']
+    return {
+        'cycles': result['cycles'],
+        'num_plants': result['num_plants'],
+        'num_prey': result['num_prey'],
+        'num_predators': result['num_predators'],
+        'elapsed': elapsed,
+        'cycles_per_sec': result['cycles'] / elapsed if elapsed else None,
+        'profiler': None,
+        'gauges': None,
+        'stop_reason': None,
+        'detector': None,
+        'cached': True,
+    }
+
+
+def run_batch(size: int, cycles: int, seed=None, report_every: int = 0,
+              backend: str = 'objects', out=sys.stdout, tiles: int = 2, profile: bool = False,
+              density: float = 1.0, detect: str = None, cache: ResultCache = None,
+              wrap: bool = False, synchronous: bool = False) -> dict:
+    # Sin print_grid ni input(): solo resúmenes cada report_every ciclos
+    rules = {'density': density} if backend == 'sparse' else {}
+    if wrap:
+        rules['wrap'] = True
+    if synchronous and backend in ('objects', 'sparse'):
+        rules['synchronous'] = True  # Los backends numpy ya son síncronos por fase
+    # Perfilar o detectar ciclos exige ejecutar de verdad
+    key = cache.key(size, cycles, seed, backend, **rules) if cache and not profile and not detect else None
+    cached = cache.get(key) if key else None
+    if cached is not None:
+        return cached_batch(cached, cycles, report_every, out)
+
+    options = {'tiles': tiles, **rules} if backend == 'tiled' else rules
+    eco = Ecosystem(size, cycles, iterative=True, backend=backend, seed=seed, **options)
+    try:
+        profiler = eco.start_profiling() if profile else None
+        detector = eco.detect_cycles(detect) if detect else None
+        series = [(eco.num_plants, eco.num_prey, eco.num_predators)]
+        start = time.perf_counter()
+        while not eco.is_simulation_over():
+            eco.update_ecosystem()
+            series.append((eco.num_plants, eco.num_prey, eco.num_predators))
+            if report_every and eco.cycle_count % report_every == 0:
+                out.write(population_summary(eco) + "\n")
+        elapsed = time.perf_counter() - start
+        if key:
+            cache.put(key, entry(series, elapsed))
+        gauges = eco.gauges()
+    finally:
+        # Los procesos de las franjas y los parches del Profiler no sobreviven a un error
+        eco.stop_profiling()
+        if backend == 'tiled':
+            eco.close()
+    return {
+        'cycles': eco.cycle_count,
+        'num_plants': eco.num_plants,
+        'num_prey': eco.num_prey,
+        'num_predators': eco.num_predators,
+        'elapsed': elapsed,
+        'cycles_per_sec': eco.cycle_count / elapsed if elapsed > 0 else float('inf'),
+        'profiler': profiler,
+        'gauges': gauges,
+        'stop_reason': eco.stop_reason,
+        'detector': detector,
+        'cached': False,
+    }
@@ -0,0 +1,191 @@
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+from .ArrayEcosystem import ArrayEcosystem
+from .Neighbours import neighbour_index
+from .PreyField import STEPS, prey_field
+from .Species import EMPTY, PLANT, PREY, PREDATOR
+
+Counts = Tuple[int, int, int]  # (plantas, presas, depredadores)
+
+
+# ======================= Mundos pequeños en lote =======================
+class BatchedWorlds:
+    """B simulaciones numpy independientes en arrays (B, N, N), un ciclo por llamada.
+
+    Cada mundo tiene su propio generador sembrado y sigue exactamente las
+    reglas de ArrayEcosystem: con la misma semilla da los mismos estados. Las
+    celdas se indexan en plano (mundo * N² + fila * N + columna), así que las
+    pasadas vectorizadas recorren todos los mundos a la vez y las colisiones
+    solo pueden darse dentro de un mismo mundo. Los mundos que terminan
+    (active, como is_simulation_over) quedan congelados; solo la siembra de
+    plantas recorre los mundos uno a uno, cada plant_regeneration_interval ciclos.
+    """
+
+    def __init__(self, size: int, max_cycles: int, seeds: Iterable[int], record: bool = False,
+                 wrap: bool = False):
+        seeds = list(seeds)
+        self.size = size
+        self.area = size * size
+        self.max_cycles = max_cycles
+        self.seeds = seeds
+        self.neighbours = neighbour_index(size, wrap)
+        self.rngs = [np.random.default_rng(seed) for seed in seeds]
+        shape = (len(seeds), size, size)
+        self.species = np.zeros(shape, dtype=np.int8)
+        self.health = np.zeros(shape, dtype=np.int16)
+        self.energy = np.zeros(shape, dtype=np.int32)
+        self.starvation_time = np.zeros(shape, dtype=np.int32)
+        self.max_starvation_time = max_cycles // 2
+        self.plant_regeneration_interval = max_cycles // 3 if max_cycles >= 3 else 1
+        self.cycle = 0  # Ciclo común de los mundos activos
+        self.cycle_count = np.zeros(len(seeds), dtype=np.int64)  # Ciclo en que quedó cada mundo
+        self.reaped = np.zeros(len(seeds), dtype=np.int64)
+        self.active = np.ones(len(seeds), dtype=bool)
+        self.history = [] if record else None  # Contadores (B, 3) por ciclo, desde el ciclo 0
+        self.initialize_organisms()
+
+    def __len__(self) -> int:
+        return len(self.seeds)
+
+    def initialize_organisms(self):
+        worlds = range(len(self))
+        self.place(worlds, PLANT, self.area // 3)
+        self.place(worlds, PREY, self.area // 5)
+        self.place(worlds, PREDATOR, self.area // 10)
+        self.end_cycle()
+
+    def place(self, worlds: Iterable[int], code: int, count: int):
+        # Mismas llamadas al generador de cada mundo que ArrayEcosystem.place
+        cells = []
+        for world in worlds:
+            empty = np.flatnonzero(self.species[world] == EMPTY)
+            chosen = self.rngs[world].choice(empty, size=min(count, len(empty)), replace=False)
+            cells.append(chosen + world * self.area)
+        if cells:
+            self.spawn(np.concatenate(cells), code, energy=0)
+
+    def spawn(self, cells: np.ndarray, code: int, energy: int):
+        self.species.flat[cells] = code
+        self.health.flat[cells] = 100
+        self.energy.flat[cells] = energy
+        self.starvation_time.flat[cells] = 0
+
+    def counts(self) -> np.ndarray:
+        # (B, 3): plantas, presas y depredadores de cada mundo en una sola pasada
+        offsets = np.arange(len(self), dtype=np.int64)[:, None, None] * 4
+        per_world = np.bincount((self.species + offsets).ravel(), minlength=4 * len(self))
+        return per_world.reshape(len(self), 4)[:, PLANT:]
+
+    def cells_of(self, mask: np.ndarray) -> np.ndarray:
+        # Índices planos de las celdas marcadas en los mundos todavía activos
+        return np.flatnonzero(mask & self.active[:, None, None])
+
+    # ---------------------- Ciclo ----------------------
+    def update(self):
+        """Avanza un ciclo todos los mundos activos."""
+        if self.cycle % self.plant_regeneration_interval == 0 and self.cycle != 0:
+            self.place(np.flatnonzero(self.active), PLANT, self.area // 6)
+        self.update_prey()
+        self.update_predators()
+        self.reap()
+        self.cycle += 1
+        self.cycle_count[self.active] = self.cycle
+        self.end_cycle()
+
+    def end_cycle(self):
+        counts = self.counts()
+        self.num_plants, self.num_prey, self.num_predators = counts.T
+        if self.history is not None:
+            self.history.append(counts.astype(np.int32))
+        self.active &= (self.cycle_count < self.max_cycles) & (self.num_prey > 0) & (self.num_predators > 0)
+
+    def is_simulation_over(self) -> bool:
+        return not self.active.any()
+
+    def run(self) -> 'BatchedWorlds':
+        while not self.is_simulation_over():
+            self.update()
+        return self
+
+    def reap(self):
+        dead = (self.species == PREDATOR) & (self.health <= 0) & self.active[:, None, None]
+        self.reaped += np.count_nonzero(dead, axis=(1, 2))
+        for array in (self.species, self.health, self.energy, self.starvation_time):
+            array[dead] = 0
+
+    def series(self) -> List[List[Counts]]:
+        """Serie (plantas, presas, depredadores) de cada mundo, como population_series."""
+        if self.history is None:
+            raise ValueError("BatchedWorlds se creó con record=False")
+        history = np.stack(self.history, axis=1).tolist()  # (B, ciclos, 3)
+        return [[tuple(counts) for counts in history[world][:self.cycle_count[world] + 1]]
+                for world in range(len(self))]
+
+    # ---------------------- Vecindad ----------------------
+    def first_adjacent(self, cells: np.ndarray, allowed: tuple) -> np.ndarray:
+        # Como ArrayEcosystem.first_adjacent, sin salir del mundo de cada celda
+        worlds, local = np.divmod(cells, self.area)
+        target = np.full(len(cells), -1, dtype=np.int64)
+        for neighbour in self.neighbours:
+            neighbour = neighbour[local]
+            inside = neighbour >= 0
+            candidate = np.where(inside, worlds * self.area + neighbour, 0)
+            valid = inside & np.isin(self.species.flat[candidate], allowed) & (target < 0)
+            target[valid] = candidate[valid]
+        return target
+
+    resolve = ArrayEcosystem.resolve
+    relocate = ArrayEcosystem.relocate
+
+    # ---------------------- Presas ----------------------
+    def update_prey(self):
+        counts = self.counts()
+        limit = np.maximum(0, counts[:, 0] - counts[:, 1] - 1)  # Crías como en ArrayEcosystem.update_prey
+        prey = self.cells_of(self.species == PREY)  # Las crías de este ciclo no se mueven hasta el siguiente
+        parents = prey[limit[prey // self.area] > 0]
+        _, births = self.resolve(parents, self.first_adjacent(parents, (EMPTY, PLANT)))
+        # Las crías salen en orden de celdas: su rango dentro del mundo decide si caben
+        worlds = births // self.area
+        rank = np.arange(len(births)) - np.searchsorted(worlds, worlds)
+        self.spawn(births[rank < limit[worlds]], PREY, energy=0)
+        sources, targets = self.resolve(prey, self.first_adjacent(prey, (EMPTY, PLANT)))
+        eats = self.species.flat[targets] == PLANT
+        self.energy.flat[sources[eats]] += 10
+        self.relocate(sources, targets)
+
+    # ---------------------- Depredadores ----------------------
+    def update_predators(self):
+        predators = self.cells_of((self.species == PREDATOR) & (self.health > 0))
+        self.starvation_time.flat[predators] += 1
+        starved = self.starvation_time.flat[predators] >= self.max_starvation_time
+        self.health.flat[predators[starved]] = 0
+
+        parents = predators[self.energy.flat[predators] >= 50]
+        parents, births = self.resolve(parents, self.first_adjacent(parents, (EMPTY,)))
+        self.spawn(births, PREDATOR, energy=10)
+        self.energy.flat[parents] = 0
+
+        targets = self.hunting_targets(predators)
+        wander = targets == -1
+        targets[wander] = self.first_adjacent(predators[wander], (EMPTY,))
+        sources, targets = self.resolve(predators, targets)
+        hunted = self.species.flat[targets] == PREY
+        self.relocate(sources, targets)
+        self.energy.flat[targets[hunted]] += 10
+        self.starvation_time.flat[targets[hunted]] = 0
+
+    def hunting_targets(self, predators: np.ndarray) -> np.ndarray:
+        # Un solo campo (B, N, N) para todos los mundos; los pasos nunca salen del mundo
+        codes = prey_field(self.species == PREY).flat[predators]
+        steps = STEPS[codes]
+        visible = codes >= 0
+        target = np.where(visible, predators + steps[:, 0] * self.size + steps[:, 1], -1)
+        reachable = np.isin(self.species.flat[np.where(visible, target, 0)], (EMPTY, PREY))
+        return np.where(visible, np.where(reachable, target, -2), -1)
+
+
+def batched_series(size: int, max_cycles: int, seeds: List[int]) -> List[List[Counts]]:
+    # Equivalente a population_series(..., backend='numpy') para cada semilla, en un solo lote
+    return BatchedWorlds(size, max_cycles, seeds, record=True).run().series()
@@ -0,0 +1,170 @@
+import importlib.util
+import json
+import platform
+import random
+import subprocess
+import sys
+import threading
+import time
+from itertools import product
+from multiprocessing import Pipe, Process
+from pathlib import Path
+from typing import Iterable, List
+
+from .Ecosystem import Ecosystem, peak_rss_kb
+from .Ensemble import quantile
+from .Species import EMPTY
+
+ROOT = Path(__file__).resolve().parent.parent
+VARIANTS = ('main', 'test', 'objects', 'numpy', 'sparse')
+PERCENTILES = (0.5, 0.9, 0.99)
+
+
+# ======================= Variantes =======================
+def load_script(name: str):
+    # main.py y test.py no son paquetes (y "test" choca con el de la stdlib)
+    spec = importlib.util.spec_from_file_location(f"bench_{name}", ROOT / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build(variant: str, size: int, cycles: int, seed: int):
+    # Reglas distintas en cada variante: main.py (visión solo por fila,
+    # reproducción al azar), test.py (sin semilla propia, solo recursivo) y el paquete
+    if variant == 'main':
+        return load_script('main').Ecosystem(size, cycles, iterative=True, seed=seed)
+    if variant == 'test':
+        random.seed(seed)
+        return load_script('test').Ecosystem(size, cycles)
+    return Ecosystem(size, cycles, iterative=True, backend=variant, seed=seed)
+
+
+def thin(eco, density: float, seed: int):
+    # density escala la población inicial por defecto (1.0 = 33% / 20% / 10%)
+    if density >= 1:
+        return
+    if not hasattr(eco, 'organisms'):  # backend numpy: solo arrays
+        import numpy as np
+        drop = np.random.default_rng(seed).random(eco.species.shape) >= density
+        for array in (eco.species, eco.health, eco.energy, eco.starvation_time):
+            array[drop] = EMPTY
+        eco.count_organisms()
+        return
+    rng = random.Random(seed)
+    for organism in list(eco.organisms):
+        if rng.random() >= density:
+            eco.delete_organism(organism)
+    for x, y in list(getattr(eco, 'plants', ())):  # Paquete: plantas en un mapa aparte
+        if rng.random() >= density:
+            eco.remove_plant(x, y)
+
+
+# ======================= Un caso =======================
+def measure(variant: str, size: int, density: float, cycles: int, seed: int) -> dict:
+    baseline = peak_rss_kb()
+    start = time.perf_counter()
+    eco = build(variant, size, cycles, seed)
+    thin(eco, density, seed)
+    setup = time.perf_counter() - start
+
+    latencies = []
+    while not eco.is_simulation_over():
+        tick = time.perf_counter_ns()
+        eco.update_ecosystem()
+        latencies.append(time.perf_counter_ns() - tick)
+    elapsed = sum(latencies) / 1e9
+    peak = peak_rss_kb()
+    return {
+        'variant': variant,
+        'size': size,
+        'density': density,
+        'max_cycles': cycles,
+        'seed': seed,
+        'cycles': len(latencies),
+        'setup_sec': setup,
+        'elapsed_sec': elapsed,
+        'cycles_per_sec': len(latencies) / elapsed if elapsed > 0 else None,
+        'latency_us': {
+            **{f"p{round(q * 100)}": quantile(latencies, q) / 1e3 for q in PERCENTILES},
+            'max': max(latencies) / 1e3,
+        } if latencies else None,
+        'peak_rss_kb': peak,
+        'rss_growth_kb': peak - baseline if peak is not None else None,
+        'final': {'num_plants': eco.num_plants, 'num_prey': eco.num_prey,
+                  'num_predators': eco.num_predators},
+    }
+
+
+def run_case(conn, *case):
+    # test.py es recursivo hasta size² niveles: pila y límite de recursión a medida
+    sys.setrecursionlimit(10 ** 6)
+    threading.stack_size(512 * 1024 * 1024)
+    result = {}
+
+    def target():
+        try:
+            result.update(measure(*case))
+        except Exception as error:
+            result.update(error=f"{type(error).__name__}: {error}")
+
+    worker = threading.Thread(target=target)
+    worker.start()
+    worker.join()
+    conn.send(result)
+    conn.close()
+
+
+def isolated(variant: str, size: int, density: float, cycles: int, seed: int) -> dict:
+    # Un proceso por caso: el pico de RSS y las cachés no se arrastran entre casos
+    receiver, sender = Pipe(duplex=False)
+    process = Process(target=run_case, args=(sender, variant, size, density, cycles, seed))
+    process.start()
+    sender.close()
+    try:
+        result = receiver.recv()
+    except EOFError:
+        result = {'variant': variant, 'size': size, 'density': density, 'max_cycles': cycles,
+                  'seed': seed, 'error': f"exit code {process.exitcode}"}
+    process.join()
+    return result
+
+
+# ======================= Matriz completa =======================
+def commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(variants: Iterable[str] = VARIANTS, sizes: Iterable[int] = (10, 30),
+                   densities: Iterable[float] = (1.0, 0.5), cycles: Iterable[int] = (30, 100),
+                   seeds: Iterable[int] = (0, 1, 2), out=sys.stderr) -> dict:
+    """Ejecuta variante × tamaño × densidad × ciclos × semilla, cada caso en su proceso.
+
+    El resultado se puede volcar con json.dump y comparar entre commits.
+    """
+    results: List[dict] = []
+    for case in product(variants, sizes, densities, cycles, seeds):
+        result = isolated(*case)
+        results.append(result)
+        if out is not None:
+            rate = result.get('cycles_per_sec')
+            out.write(f"{case[0]:>8} size={case[1]} density={case[2]} cycles={case[3]} "
+                      f"seed={case[4]}: " + (result['error'] if 'error' in result
+                                             else f"{rate:.1f} ciclos/s" if rate else "0 ciclos")
+                      + "\n")
+    return {
+        'commit': commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def write_report(report: dict, path: str):
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
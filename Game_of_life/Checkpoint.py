@@ -0,0 +1,167 @@
+import math
+import mmap
+import random
+import struct
+
+from .AgentSchedule import AgentSchedule
+from .CycleDetector import zobrist_of
+from .Ecosystem import Ecosystem
+from .EmptyCells import EmptyCells
+from .Plant import Plant
+from .Predator import Predator
+from .Prey import Prey
+from .Species import CLASSES, PLANT, code_of
+
+# Formato binario (little endian), cada sección alineada a 8 bytes:
+#   cabecera | especies (size² bytes) | estado RNG | datos del backend
+# objects: un registro por organismo en orden de turno (presas, depredadores) + celdas vacías
+#          (las plantas salen de la sección de especies)
+# numpy:   health int16, energy int32, starvation_time int32 (size² cada uno)
+#          (tiled se guarda igual y se carga como numpy: ambos dan los mismos ciclos)
+# El byte de modo lleva iterative en el bit 0, wrap en el bit 1 y synchronous en el bit 2.
+MAGIC = b'GOLC'
+VERSION = 1
+BACKENDS = ('objects', 'numpy')
+HEADER = struct.Struct('<4sHBBIIIIIIIII')
+RECORD = struct.Struct('<IIBxxxiiii')  # x, y, especie, health, energy, starvation, max_starvation
+PY_RNG = struct.Struct('<I625Id')      # versión, estado Mersenne Twister, gauss_next
+PCG64 = struct.Struct('<16s16sII')     # state, inc, has_uint32, uinteger
+
+
+def align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def pack_rng(eco: Ecosystem) -> bytes:
+    if eco.backend in ('numpy', 'tiled'):
+        state = eco.rng.bit_generator.state
+        return PCG64.pack(state['state']['state'].to_bytes(16, 'little'),
+                          state['state']['inc'].to_bytes(16, 'little'),
+                          state['has_uint32'], state['uinteger'])
+    version, internal, gauss = eco.rng.getstate()
+    return PY_RNG.pack(version, *internal, math.nan if gauss is None else gauss)
+
+
+def unpack_rng(eco: Ecosystem, blob: bytes):
+    if eco.backend == 'numpy':
+        import numpy as np
+        state, inc, has_uint32, uinteger = PCG64.unpack(blob)
+        eco.rng = np.random.Generator(np.random.PCG64())
+        eco.rng.bit_generator.state = {
+            'bit_generator': 'PCG64',
+            'state': {'state': int.from_bytes(state, 'little'), 'inc': int.from_bytes(inc, 'little')},
+            'has_uint32': has_uint32, 'uinteger': uinteger,
+        }
+        return
+    values = PY_RNG.unpack(blob)
+    eco.rng = random.Random()
+    eco.rng.setstate((values[0], tuple(values[1:-1]), None if math.isnan(values[-1]) else values[-1]))
+
+
+def save_checkpoint(eco: Ecosystem, path: str):
+    backend = 'numpy' if eco.backend == 'tiled' else eco.backend
+    if backend not in BACKENDS:
+        raise ValueError(f"El backend {eco.backend!r} no admite checkpoints (disponibles: "
+                         f"{', '.join(BACKENDS)} y tiled)")
+    rng = pack_rng(eco)
+    if eco.backend == 'tiled':
+        species = eco.species_bytes()
+        payload = [array.tobytes() for array in eco.state_arrays()]
+        organisms, empty = 0, 0
+    elif eco.backend == 'numpy':
+        species = eco.species_bytes()
+        payload = [eco.health.tobytes(), eco.energy.tobytes(), eco.starvation_time.tobytes()]
+        organisms, empty = 0, 0
+    else:
+        species = eco.species_bytes()
+        records = bytearray()
+        for org in eco.organisms:
+            starvation = (org.starvation_time, org.max_starvation_time) if isinstance(org, Predator) else (0, 0)
+            records += RECORD.pack(org.x, org.y, code_of(org), org.health, org.energy, *starvation)
+        payload = [bytes(records), struct.pack(f'<{len(eco.empty_cells)}I', *eco.empty_cells.cells)]
+        organisms, empty = len(eco.organisms), len(eco.empty_cells)
+
+    mode = int(eco.iterative) | int(eco.wrap) << 1 | int(getattr(eco, 'synchronous', False)) << 2
+    header = HEADER.pack(MAGIC, VERSION, BACKENDS.index(backend), mode, eco.size,
+                         eco.max_cycles, eco.cycle_count, eco.num_plants, eco.num_prey,
+                         eco.num_predators, organisms, empty, len(rng))
+    with open(path, 'wb') as file:
+        for section in [header, species, rng] + payload:
+            file.write(section)
+            file.write(b'\0' * (align(len(section)) - len(section)))
+
+
+def load_checkpoint(path: str) -> Ecosystem:
+    with open(path, 'rb') as file:
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    (magic, version, backend, mode, size, max_cycles, cycle_count, num_plants, num_prey,
+     num_predators, organisms, empty, rng_bytes) = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} no es un checkpoint de Ecosystem v{VERSION}")
+
+    eco = Ecosystem.__new__(Ecosystem, backend=BACKENDS[backend])
+    eco.configure(size, max_cycles, bool(mode & 1), BACKENDS[backend], bool(mode & 2), bool(mode & 4))
+    eco.cycle_count = cycle_count
+    eco.num_plants, eco.num_prey, eco.num_predators = num_plants, num_prey, num_predators
+
+    offset = align(HEADER.size)
+    species_offset = offset
+    offset = align(offset + size * size)
+    unpack_rng(eco, data[offset:offset + rng_bytes])
+    offset = align(offset + rng_bytes)
+
+    if eco.backend == 'numpy':
+        load_arrays(eco, path, species_offset, offset)
+    else:
+        load_organisms(eco, data, species_offset, offset, organisms, empty)
+        data.close()
+    return eco
+
+
+def load_arrays(eco: Ecosystem, path: str, species_offset: int, offset: int):
+    import numpy as np
+    # Copia en escritura: las páginas se leen bajo demanda y el archivo no se modifica
+    shape = (eco.size, eco.size)
+    eco.species = np.memmap(path, np.int8, 'c', species_offset, shape)
+    for name, dtype in (('health', np.int16), ('energy', np.int32), ('starvation_time', np.int32)):
+        setattr(eco, name, np.memmap(path, dtype, 'c', offset, shape))
+        offset = align(offset + eco.size * eco.size * np.dtype(dtype).itemsize)
+
+
+def load_organisms(eco: Ecosystem, data: mmap.mmap, species_offset: int, offset: int,
+                   organisms: int, empty: int):
+    size = eco.size
+    species = data[species_offset:species_offset + size * size]
+    # create_world sin create_matrix (recursiva) ni un EmptyCells lleno que se tiraría después
+    eco.grid = [[None] * size for _ in range(size)]
+    eco.organisms = AgentSchedule()
+    eco.prey_index = eco.create_prey_index()
+    eco.plants = eco.create_plants()
+    for cell, code in enumerate(species):
+        if code == PLANT:
+            eco.plants.add(*divmod(cell, size))
+    eco.num_plants = len(eco.plants)
+    eco.zobrist = zobrist_of(species)
+
+    end = offset + organisms * RECORD.size
+    for x, y, code, health, energy, starvation, max_starvation in RECORD.iter_unpack(data[offset:end]):
+        cls = CLASSES[code]
+        if cls is Plant:
+            continue  # Checkpoints anteriores al mapa de bits
+        if cls is Predator:
+            org = Predator(x, y, health, energy, starvation, max_starvation)
+        else:
+            org = cls(x, y, health, energy)
+        eco.organisms.append(org)
+        # Solo ocupa la celda si coincide con la cuadrícula guardada (el último gana)
+        if species[x * size + y] == code:
+            eco.grid[x][y] = org
+    for x, row in enumerate(eco.grid):
+        for y, org in enumerate(row):
+            if isinstance(org, Prey):
+                eco.prey_index.add(x, y)
+
+    offset = align(end)
+    eco.empty_cells = EmptyCells(size, full=False)
+    eco.empty_cells.cells = list(struct.unpack_from(f'<{empty}I', data, offset))
+    eco.empty_cells.positions = {cell: index for index, cell in enumerate(eco.empty_cells.cells)}
@@ -0,0 +1,87 @@
+MASK = (1 << 64) - 1
+
+
+# ======================= Hash de Zobrist =======================
+def zobrist_key(cell: int, code: int) -> int:
+    # Clave pseudoaleatoria de 64 bits para (celda, especie), sin tabla:
+    # splitmix64 sobre cell * 4 + code, así sirve también para mundos dispersos
+    z = ((cell << 2 | code) * 0x9E3779B97F4A7C15) & MASK
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK
+    return z ^ (z >> 31)
+
+
+def zobrist_of(species: bytes) -> int:
+    # Hash completo de una cuadrícula de códigos; los cambios se aplican con XOR
+    h = 0
+    for cell, code in enumerate(species):
+        if code:
+            h ^= zobrist_key(cell, code)
+    return h
+
+
+# ======================= Detección de ciclos =======================
+class CycleDetector:
+    """Detecta cuándo la simulación vuelve a un estado ya visto.
+
+    Cada ciclo compara el hash de la disposición (ecosystem.layout_hash(),
+    O(1) en los backends de objetos gracias a Zobrist). Si se repite tras P
+    ciclos, guarda la huella completa del estado (state_fingerprint(): también
+    energía, hambre, orden de turno, RNG y fase de regeneración) y la compara
+    P ciclos después. Confirmado el periodo, la evolución es determinista:
+    mode='stop' termina ya; mode='jump' ejecuta solo los (max_cycles - c) % P
+    ciclos que faltan para coincidir con el estado final y salta a max_cycles.
+    """
+
+    def __init__(self, mode: str = 'jump'):
+        if mode not in ('stop', 'jump'):
+            raise ValueError(f"modo desconocido: {mode}")
+        self.mode = mode
+        self.seen = {}  # hash de disposición -> último ciclo en que apareció
+        self.candidate = None  # (ciclo, periodo, hash, huella)
+        self.since = None  # primer ciclo confirmado dentro del ciclo de estados
+        self.period = None
+        self.jump_at = None
+        self.skipped = 0  # ciclos ahorrados con mode='jump'
+
+    def end_cycle(self, ecosystem: 'Ecosystem'):
+        cycle = ecosystem.cycle_count
+        if self.jump_at is not None:
+            if cycle >= self.jump_at:
+                self.finish(ecosystem)
+            return
+
+        layout = ecosystem.layout_hash()
+        if self.candidate is not None:
+            start, period, expected, fingerprint = self.candidate
+            if cycle == start + period:
+                self.candidate = None
+                if layout == expected and ecosystem.state_fingerprint() == fingerprint:
+                    self.confirm(ecosystem, start, period)
+                    return
+        if self.candidate is None and layout in self.seen:
+            self.candidate = (cycle, cycle - self.seen[layout], layout, ecosystem.state_fingerprint())
+        self.seen[layout] = cycle
+
+    def confirm(self, ecosystem: 'Ecosystem', start: int, period: int):
+        self.since, self.period = start, period
+        self.seen.clear()
+        remaining = (ecosystem.max_cycles - ecosystem.cycle_count) % period
+        if self.mode == 'stop' or remaining == 0:
+            self.finish(ecosystem)
+        else:
+            self.jump_at = ecosystem.cycle_count + remaining
+
+    def finish(self, ecosystem: 'Ecosystem'):
+        ecosystem.stop_reason = 'steady' if self.period == 1 else 'periodic'
+        if self.mode == 'jump' and ecosystem.cycle_count < ecosystem.max_cycles:
+            self.skipped = ecosystem.max_cycles - ecosystem.cycle_count
+            ecosystem.cycle_count = ecosystem.max_cycles
+        self.jump_at = None
+
+    def describe(self) -> str:
+        if self.period is None:
+            return "sin ciclo detectado"
+        kind = "estado estacionario" if self.period == 1 else f"ciclo de periodo {self.period}"
+        jump = f", {self.skipped} ciclos saltados" if self.skipped else ""
+        return f"{kind} desde el ciclo {self.since}{jump}"
@@ -1,19 +1,110 @@
+import random
+import sys
+
+from .EmptyCells import EmptyCells
+from .Neighbours import neighbour_table
+from .Organism import Organism
+from .AgentSchedule import AgentSchedule
+from .CycleDetector import zobrist_key
+from .OrganismRegistry import OrganismRegistry
+from .Plant import Plant
+from .PlantBitmap import PlantBitmap
+from .Prey import Prey
+from .Predator import Predator
+from .PreyIndex import PreyIndex
+from .Species import EMPTY, PLANT, PREDATOR, PREY, SYMBOLS, code_of
+from .TerminalRenderer import TerminalRenderer
+
+
+def peak_rss_kb():
+    # Memoria máxima del proceso; resource solo existe en Unix, en Windows da None
+    try:
+        import resource
+    except ImportError:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
 # ======================= Ecosistema =======================
 class Ecosystem:
-    def __init__(self, size: int, max_cycles: int):
+    def __new__(cls, *args, backend: str = 'objects', **kwargs):
+        # backend='numpy' construye el ecosistema vectorizado (requiere numpy);
+        # backend='tiled' lo reparte en franjas, una por proceso;
+        # backend='sparse' solo guarda las celdas ocupadas
+        if cls is not Ecosystem or backend == 'objects':
+            pass
+        elif backend == 'numpy':
+            from .ArrayEcosystem import ArrayEcosystem
+            cls = ArrayEcosystem
+        elif backend == 'tiled':
+            from .TiledEcosystem import TiledEcosystem
+            cls = TiledEcosystem
+        elif backend == 'sparse':
+            from .SparseEcosystem import SparseEcosystem
+            cls = SparseEcosystem
+        else:
+            raise ValueError(f"Backend desconocido: {backend!r} (objects, numpy, tiled o sparse)")
+        return super().__new__(cls)
+
+    def __init__(self, size: int, max_cycles: int, iterative: bool = False, *, backend: str = 'objects',
+                 seed=None, wrap: bool = False, synchronous: bool = False):
+        # Los backends derivados no repiten este arranque: cambian las piezas con los create_*
+        self.configure(size, max_cycles, iterative, backend, wrap, synchronous)
+        # Generador propio: la misma semilla reproduce la misma simulación
+        self.rng = self.create_rng(seed)
+        self.create_world()
+        self.initialize_organisms()
+
+    def configure(self, size: int, max_cycles: int, iterative: bool, backend: str, wrap: bool,
+                  synchronous: bool):
+        # Estado común a todos los backends, con el mundo aún vacío (load_checkpoint lo rellena)
         self.size = size
         self.max_cycles = max_cycles
-        self.grid = self.create_matrix(size, size)
-        self.organisms = []
+        # Modo iterativo: misma lógica con bucles, profundidad de pila constante
+        self.iterative = iterative
+        self.backend = backend
+        self.wrap = wrap  # Mundo toroidal: los bordes son vecinos entre sí
+        self.neighbours = self.create_neighbours(size, wrap)  # Vecinos por índice plano x * size + y
+        # Modo síncrono: todos deciden sobre el mismo estado y luego se resuelven conflictos
+        self.synchronous = synchronous
         self.num_plants = 0
         self.num_prey = 0
         self.num_predators = 0
         self.cycle_count = 0
         self.plant_regeneration_interval = max_cycles // 3 if max_cycles >=3 else 1
-        self.previous_grid = None  # Guarda el estado anterior del ecosistema
-        self.initialize_organisms()
+        self.reaped = 0  # Organismos muertos retirados por reap() en toda la simulación
+        self.zobrist = 0  # Hash de la disposición, se mantiene en cada alta/baja/movimiento
+        self.stop_reason = None  # 'steady'/'periodic' si el detector terminó la simulación
+        self.recorder = None  # TrajectoryRecorder activo, ver start_recording
+        self.profiler = None  # Profiler activo, ver start_profiling
+        self.detector = None  # CycleDetector activo, ver detect_cycles
+
+    def create_world(self):
+        self.grid = self.create_matrix(self.size, self.size)
+        self.plants = self.create_plants()  # Las plantas no ocupan grid ni organisms
+        self.empty_cells = self.create_empty_cells()  # Se mantiene en add/delete/move
+        self.organisms = AgentSchedule()  # Una cola por especie móvil
+        self.prey_index = self.create_prey_index()
+
+    # Piezas que cambian los backends derivados
+    def create_rng(self, seed):
+        return random.Random(seed)
+
+    def create_neighbours(self, size: int, wrap: bool):
+        return neighbour_table(size, wrap)
+
+    def create_plants(self):
+        return PlantBitmap(self.size)
+
+    def create_empty_cells(self):
+        return EmptyCells(self.size)
+
+    def create_prey_index(self):
+        return PreyIndex(self.size)
 
     def create_matrix(self, rows: int, cols: int, matrix=None):
+        if self.iterative:
+            return [[None] * cols for _ in range(rows)]
         if matrix is None:
             matrix = []
         if len(matrix) == rows:
@@ -31,83 +122,259 @@ class Ecosystem:
         plants = total // 3  # 33% plantas
         prey = total // 5    # 20% presas
         predators = total // 10  # 10% depredadores
-        self.add_organisms(plants, Plant, self.get_empty_cells([]))
-        self.add_organisms(prey, Prey, self.get_empty_cells([]))
-        self.add_organisms(predators, Predator, self.get_empty_cells([]))
+        self.add_organisms(plants, Plant, self.empty_cells.sample(plants, self.rng))
+        self.add_organisms(prey, Prey, self.empty_cells.sample(prey, self.rng))
+        self.add_organisms(predators, Predator, self.empty_cells.sample(predators, self.rng))
 
     def add_organisms(self, count: int, org_type: type, cells: list, index: int = 0):
+        if self.iterative:
+            self.add_organisms_iterative(count, org_type, cells, index)
+            return
         if count <= 0 or index >= len(cells):
             return
-        x, y = cells[index]
+        self.place(org_type, *cells[index])
+        self.add_organisms(count - 1, org_type, cells, index + 1)
+
+    def add_organisms_iterative(self, count: int, org_type: type, cells: list, index: int = 0):
+        for x, y in cells[index:index + max(count, 0)]:
+            self.place(org_type, x, y)
+
+    def place(self, org_type: type, x: int, y: int):
         if org_type == Plant:
-            self.add_organism(Plant(x, y, 100, 0))
-        elif org_type == Prey:
-            self.add_organism(Prey(x, y, 100, 0))
+            self.add_plant(x, y)
+        else:
+            self.add_organism(self.new_organism(org_type, x, y))
+
+    def new_organism(self, org_type: type, x: int, y: int) -> Organism:
+        if org_type == Prey:
+            return Prey(x, y, 100, 0)
         elif org_type == Predator:
-            self.add_organism(Predator(x, y, 100, 0, 0, self.max_cycles // 2))
-        self.add_organisms(count - 1, org_type, cells, index + 1)
+            return Predator(x, y, 100, 0, 0, self.max_cycles // 2)
 
     def get_empty_cells(self, acc: list, x=0, y=0):
+        # Recorrido de referencia: debe coincidir con el índice empty_cells
+        if self.iterative:
+            return self.get_empty_cells_iterative(acc)
         if x >= self.size:
-            random.shuffle(acc)
+            self.rng.shuffle(acc)
             return acc
         if y >= self.size:
             return self.get_empty_cells(acc, x+1, 0)
-        if self.grid[x][y] is None:
+        if self.grid[x][y] is None and (x, y) not in self.plants:
             acc.append((x, y))
         return self.get_empty_cells(acc, x, y+1)
 
+    def get_empty_cells_iterative(self, acc: list):
+        for x, row in enumerate(self.grid):
+            for y, cell in enumerate(row):
+                if cell is None and (x, y) not in self.plants:
+                    acc.append((x, y))
+        self.rng.shuffle(acc)
+        return acc
+
+    def add_plant(self, x: int, y: int):
+        if self.plants.add(x, y):
+            self.empty_cells.discard(x, y)
+            self.zobrist ^= zobrist_key(x * self.size + y, PLANT)
+            self.num_plants += 1
+            if self.recorder is not None:
+                self.recorder.cell(x, y, PLANT)
+
+    def remove_plant(self, x: int, y: int):
+        if self.plants.discard(x, y):
+            self.empty_cells.add(x, y)
+            self.zobrist ^= zobrist_key(x * self.size + y, PLANT)
+            self.num_plants -= 1
+            if self.recorder is not None:
+                self.recorder.cell(x, y, EMPTY)
+
     def add_organism(self, organism: Organism):
+        # Una cría que nace sobre una planta la pisa
+        self.remove_plant(organism.x, organism.y)
         self.grid[organism.x][organism.y] = organism
+        self.empty_cells.discard(organism.x, organism.y)
         self.organisms.append(organism)
-        if isinstance(organism, Plant):
-            self.num_plants += 1
-        elif isinstance(organism, Prey):
+        if self.recorder is not None:
+            self.recorder.cell(organism.x, organism.y, code_of(organism))
+        if isinstance(organism, Prey):
             self.num_prey += 1
+            self.prey_index.add(organism.x, organism.y)
+            self.zobrist ^= zobrist_key(organism.x * self.size + organism.y, PREY)
         elif isinstance(organism, Predator):
             self.num_predators += 1
+            self.zobrist ^= zobrist_key(organism.x * self.size + organism.y, PREDATOR)
 
     def delete_organism(self, organism: Organism):
         self.grid[organism.x][organism.y] = None
+        self.empty_cells.add(organism.x, organism.y)
         self.organisms.remove(organism)
-        if isinstance(organism, Plant):
-            self.num_plants -= 1
-        elif isinstance(organism, Prey):
+        if self.recorder is not None:
+            self.recorder.cell(organism.x, organism.y, EMPTY)
+        if isinstance(organism, Prey):
             self.num_prey -= 1
+            self.prey_index.remove(organism.x, organism.y)
+            self.zobrist ^= zobrist_key(organism.x * self.size + organism.y, PREY)
         elif isinstance(organism, Predator):
             self.num_predators -= 1
+            self.zobrist ^= zobrist_key(organism.x * self.size + organism.y, PREDATOR)
 
     def move_organism(self, organism: Organism, new_x: int, new_y: int):
+        old_x, old_y = organism.x, organism.y
         self.grid[organism.x][organism.y] = None
+        self.empty_cells.add(organism.x, organism.y)
+        if isinstance(organism, Prey):
+            self.prey_index.remove(organism.x, organism.y)
+            self.prey_index.add(new_x, new_y)
         organism.x = new_x
         organism.y = new_y
         self.grid[new_x][new_y] = organism
+        self.empty_cells.discard(new_x, new_y)
+        code = code_of(organism)
+        self.zobrist ^= zobrist_key(old_x * self.size + old_y, code)
+        self.zobrist ^= zobrist_key(new_x * self.size + new_y, code)
+        if self.recorder is not None:
+            self.recorder.move(old_x, old_y, new_x, new_y, code)
 
     def update_ecosystem(self):
-        # Guardar el estado actual antes de actualizar
-        self.previous_grid = [[cell.get_symbol() if cell else '.' for cell in row] for row in self.grid]
-        
         if self.cycle_count % self.plant_regeneration_interval == 0:
-            self.regenerate_plants(self.get_empty_cells([]))
-        self.update_organisms(0)
+            self.regenerate_plants()
+        self.update_organisms()
+        self.reap()
+        self.organisms.compact()
         self.cycle_count += 1
+        if self.recorder is not None:
+            self.recorder.end_cycle(self)
+        if self.detector is not None:
+            self.detector.end_cycle(self)
 
-    def regenerate_plants(self, cells: list):
-        if len(cells) == 0 or self.cycle_count == 0:
+    def regenerate_plants(self):
+        if len(self.empty_cells) == 0 or self.cycle_count == 0:
             return
-        num = min(len(cells), (self.size**2) // 6)
-        self.add_organisms(num, Plant, cells)
+        num = min(len(self.empty_cells), (self.size**2) // 6)
+        self.add_organisms(num, Plant, self.empty_cells.sample(num, self.rng))
 
-    def update_organisms(self, index: int):
-        if index >= len(self.organisms):
+    def update_organisms(self):
+        # Una fase por especie (presas, luego depredadores). Cada cola se recorre
+        # hasta su longitud inicial: las crías esperan al ciclo siguiente
+        if self.synchronous:
+            self.update_organisms_synchronous()
             return
-        org = self.organisms[index]
-        if org.is_alive():
+        for queue in self.organisms.queues.values():
+            self.update_queue(queue, 0, len(queue.slots))
+
+    def update_queue(self, queue: OrganismRegistry, index: int, end: int):
+        if self.iterative:
+            self.update_queue_iterative(queue, index, end)
+            return
+        if index >= end:
+            return
+        org = queue.slots[index]
+        if org is not None and org.is_alive():
             org.update_state(self)
             org.move(self)
-        self.update_organisms(index + 1)
+        self.update_queue(queue, index + 1, end)
+
+    def update_queue_iterative(self, queue: OrganismRegistry, index: int, end: int):
+        slots = queue.slots
+        while index < end:
+            org = slots[index]
+            if org is not None and org.is_alive():
+                org.update_state(self)
+                org.move(self)
+            index += 1
+
+    def update_organisms_synchronous(self):
+        # Primero todos los organismos deciden (solo leen: cada intención depende del
+        # estado al empezar el ciclo, no del orden ni de quién la calcule); luego se aplican
+        intents = []
+        for queue in self.organisms.queues.values():
+            self.collect_intents(queue, 0, len(queue.slots), intents)
+        self.resolve_intents(intents)
+
+    def collect_intents(self, queue: OrganismRegistry, index: int, end: int, acc: list) -> list:
+        if self.iterative:
+            return self.collect_intents_iterative(queue, index, end, acc)
+        if index >= end:
+            return acc
+        org = queue.slots[index]
+        if org is not None and org.is_alive():
+            acc.append(org.intent(self))
+        return self.collect_intents(queue, index + 1, end, acc)
+
+    def collect_intents_iterative(self, queue: OrganismRegistry, index: int, end: int, acc: list) -> list:
+        acc.extend(org.intent(self) for org in queue.slots[index:end] if org is not None and org.is_alive())
+        return acc
+
+    def resolve_intents(self, intents: list):
+        """Aplica las intenciones en orden de turno; ante un conflicto gana la primera.
+
+        Dos organismos que quieren la misma celda libre: se la queda el primero
+        y el otro no se mueve (o su cría no nace). Varios depredadores tras la
+        misma presa: la caza el primero y la presa no llega a actuar.
+        """
+        hunters = {}
+        for intent in intents:
+            if intent.prey is not None:
+                hunters.setdefault(id(intent.prey), intent.organism)
+        self.apply_intents(intents, 0, set(), hunters)
+
+    def apply_intents(self, intents: list, index: int, claimed: set, hunters: dict):
+        if self.iterative:
+            self.apply_intents_iterative(intents, index, claimed, hunters)
+            return
+        if index >= len(intents):
+            return
+        intents[index].organism.apply_intent(self, intents[index], claimed, hunters)
+        self.apply_intents(intents, index + 1, claimed, hunters)
+
+    def apply_intents_iterative(self, intents: list, index: int, claimed: set, hunters: dict):
+        for intent in intents[index:]:
+            intent.organism.apply_intent(self, intent, claimed, hunters)
+
+    def reap(self):
+        # Los depredadores muertos de hambre dejan la cuadrícula, el registro y los contadores
+        for queue in self.organisms.queues.values():
+            self.reap_queue(queue, 0)
+
+    def reap_queue(self, queue: OrganismRegistry, index: int):
+        if self.iterative:
+            self.reap_queue_iterative(queue, index)
+            return
+        if index >= len(queue.slots):
+            return
+        org = queue.slots[index]
+        if org is not None and not org.is_alive():
+            self.delete_organism(org)
+            self.reaped += 1
+        self.reap_queue(queue, index + 1)
+
+    def reap_queue_iterative(self, queue: OrganismRegistry, index: int):
+        for org in queue.slots[index:]:
+            if org is not None and not org.is_alive():
+                self.delete_organism(org)
+                self.reaped += 1
+
+    def gauges(self) -> dict:
+        # Población y memoria al final del último ciclo
+        return {
+            'cycle': self.cycle_count,
+            'num_plants': self.num_plants,
+            'num_prey': self.num_prey,
+            'num_predators': self.num_predators,
+            'reaped': self.reaped,
+            **self.memory_gauges(),
+            'peak_rss_kb': peak_rss_kb(),
+        }
+
+    def memory_gauges(self) -> dict:
+        return {'organism_slots': self.organisms.slot_count(), 'empty_cells': len(self.empty_cells),
+                'plant_bytes': len(self.plants.bits)}
 
     def print_grid(self, row=0):
+        # Cuadro sin resaltar; run_simulation usa TerminalRenderer, que marca los cambios
+        if self.iterative:
+            self.print_grid_iterative(row)
+            return
         if row >= self.size:
             print(f"Plantas: {self.num_plants} | Presas: {self.num_prey} | Depredadores: {self.num_predators}")
             print(f"Ciclo: {self.cycle_count}/{self.max_cycles}")
@@ -115,34 +382,108 @@ class Ecosystem:
         self.print_row(row, 0)
         self.print_grid(row + 1)
 
+    def print_grid_iterative(self, row=0):
+        for current in range(row, self.size):
+            self.print_row_iterative(current)
+        print(f"Plantas: {self.num_plants} | Presas: {self.num_prey} | Depredadores: {self.num_predators}")
+        print(f"Ciclo: {self.cycle_count}/{self.max_cycles}")
+
     def print_row(self, row: int, col: int):
         if col >= self.size:
             print()
             return
-        current_symbol = self.grid[row][col].get_symbol() if self.grid[row][col] else '.'
-        previous_symbol = self.previous_grid[row][col] if self.previous_grid else '.'
-        
-        # Resaltar cambios con colores
-        if current_symbol != previous_symbol:
-            print(f"\033[91m{current_symbol}\033[0m", end=' ')  # Rojo para cambios
-        else:
-            print(current_symbol, end=' ')
+        print(self.symbol_at(row, col), end=' ')
         self.print_row(row, col + 1)
 
+    def print_row_iterative(self, row: int):
+        for col in range(self.size):
+            print(self.symbol_at(row, col), end=' ')
+        print()
+
+    def symbol_at(self, x: int, y: int) -> str:
+        cell = self.grid[x][y]
+        if cell is not None:
+            return cell.get_symbol()
+        return SYMBOLS[PLANT] if (x, y) in self.plants else SYMBOLS[EMPTY]
+
+    def species_bytes(self) -> bytes:
+        # Un byte por celda en orden de filas (códigos de Species)
+        cells = bytearray(code_of(cell) for row in self.grid for cell in row)
+        for x, y in self.plants:
+            cells[x * self.size + y] = PLANT
+        return bytes(cells)
+
+    def start_recording(self, path: str, keyframe_every: int = 0):
+        from .Trajectory import TrajectoryRecorder
+        self.recorder = TrajectoryRecorder(path, self, keyframe_every)
+        return self.recorder
+
+    def stop_recording(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def start_profiling(self):
+        # Envuelve las fases y métodos calientes hasta stop_profiling()
+        from .Profiler import Profiler
+        self.profiler = Profiler(self)
+        return self.profiler
+
+    def stop_profiling(self):
+        if self.profiler is not None:
+            self.profiler.stop()
+            self.profiler = None
+
+    def detect_cycles(self, mode: str = 'jump'):
+        # Termina (o salta a max_cycles) cuando el estado entra en un ciclo
+        from .CycleDetector import CycleDetector
+        self.detector = CycleDetector(mode)
+        return self.detector
+
+    def layout_hash(self) -> int:
+        return self.zobrist
+
+    def state_fingerprint(self) -> tuple:
+        # Todo lo que decide los ciclos siguientes; las plantas van en el hash de Zobrist
+        agents = tuple(tuple((org.x, org.y, org.health, org.energy, getattr(org, 'starvation_time', 0))
+                             for org in queue) for queue in self.organisms.queues.values())
+        return (self.zobrist, agents, self.cycle_count % self.plant_regeneration_interval,
+                self.rng.getstate())
+
+    def save_checkpoint(self, path: str):
+        from .Checkpoint import save_checkpoint
+        save_checkpoint(self, path)
+
+    @classmethod
+    def load_checkpoint(cls, path: str) -> 'Ecosystem':
+        from .Checkpoint import load_checkpoint
+        return load_checkpoint(path)
+
     def is_simulation_over(self):
-        return (self.cycle_count >= self.max_cycles or 
+        return (self.stop_reason is not None or
+                self.cycle_count >= self.max_cycles or 
                 self.num_predators == 0 or 
                 self.num_prey == 0)
 
-    def run_simulation(self):
+    def run_simulation(self, renderer: 'TerminalRenderer' = None):
+        renderer = renderer or TerminalRenderer()
+        if self.iterative:
+            self.run_simulation_iterative(renderer)
+            return
         if self.is_simulation_over():
             return
-        self.print_grid()
+        renderer.render(self)
         input("Enter para siguiente ciclo...")
-        sys.stdout.write("\033[F\033[K" * (self.size + 3))
         self.update_ecosystem()
-        self.run_simulation()
+        self.run_simulation(renderer)
+
+    def run_simulation_iterative(self, renderer: 'TerminalRenderer' = None):
+        renderer = renderer or TerminalRenderer()
+        while not self.is_simulation_over():
+            renderer.render(self)
+            input("Enter para siguiente ciclo...")
+            self.update_ecosystem()
 
 if __name__ == "__main__":
-    eco = Ecosystem(size=5, max_cycles=30)
-    eco.run_simulation()
\ No newline at end of file
+    eco = Ecosystem(size=5, max_cycles=30, iterative="--iterative" in sys.argv)
+    eco.run_simulation()
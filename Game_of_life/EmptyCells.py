@@ -0,0 +1,50 @@
+import random
+from typing import List, Tuple
+
+
+# ======================= Índice de celdas vacías =======================
+class EmptyCells:
+    """Conjunto de celdas libres con alta, baja y muestreo aleatorio en O(1).
+
+    Las celdas se guardan como índice plano x * size + y en una lista densa;
+    `positions` indica dónde está cada una para poder borrar intercambiando
+    con la última.
+    """
+
+    def __init__(self, size: int, full: bool = True):
+        self.size = size
+        self.cells = list(range(size * size)) if full else []
+        self.positions = {cell: index for index, cell in enumerate(self.cells)}
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __contains__(self, cell: Tuple[int, int]) -> bool:
+        return cell[0] * self.size + cell[1] in self.positions
+
+    def add(self, x: int, y: int):
+        cell = x * self.size + y
+        if cell in self.positions:
+            return
+        self.positions[cell] = len(self.cells)
+        self.cells.append(cell)
+
+    def discard(self, x: int, y: int):
+        index = self.positions.pop(x * self.size + y, None)
+        if index is None:
+            return
+        last = self.cells.pop()
+        if index < len(self.cells):
+            self.cells[index] = last
+            self.positions[last] = index
+
+    def sample(self, k: int, rng: random.Random) -> List[Tuple[int, int]]:
+        # Fisher-Yates parcial: solo se barajan las k primeras posiciones
+        k = min(k, len(self.cells))
+        cells, positions = self.cells, self.positions
+        for i in range(k):
+            j = rng.randrange(i, len(cells))
+            cells[i], cells[j] = cells[j], cells[i]
+            positions[cells[i]] = i
+            positions[cells[j]] = j
+        return [divmod(cell, self.size) for cell in cells[:k]]
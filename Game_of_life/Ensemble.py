@@ -0,0 +1,110 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from .Ecosystem import Ecosystem
+from .ResultCache import ResultCache, entry
+
+Counts = Tuple[int, int, int]  # (plantas, presas, depredadores)
+SPECIES = ('num_plants', 'num_prey', 'num_predators')
+
+
+# ======================= Conjuntos Monte Carlo =======================
+def population_series(size: int, max_cycles: int, seed: int, backend: str = 'objects') -> List[Counts]:
+    # Solo viajan de vuelta los contadores por ciclo, nunca la cuadrícula
+    eco = Ecosystem(size, max_cycles, iterative=True, backend=backend, seed=seed)
+    try:
+        series = [(eco.num_plants, eco.num_prey, eco.num_predators)]
+        while not eco.is_simulation_over():
+            eco.update_ecosystem()
+            series.append((eco.num_plants, eco.num_prey, eco.num_predators))
+    finally:
+        if backend == 'tiled':
+            eco.close()  # Sin esperar al recolector: una semilla, dos procesos
+    return series
+
+
+def run_ensemble(size: int, max_cycles: int, seeds: Iterable[int], workers=None,
+                 backend: str = 'objects', cache: ResultCache = None) -> Iterator[Tuple[int, List[Counts]]]:
+    """Ejecuta una simulación por semilla y devuelve (semilla, serie) en orden.
+
+    Cada Ecosystem usa su propio generador sembrado, así que el resultado no
+    depende de cuántos procesos se usen. workers=1 ejecuta en este proceso.
+    Con cache, solo se reparten las semillas que no estén ya guardadas.
+    backend='batched' avanza todas las semillas a la vez en arrays (B, N, N)
+    con las reglas de numpy; conviene para muchos mundos pequeños.
+    """
+    seeds = list(seeds)
+    keys = {seed: ResultCache.key(size, max_cycles, seed, backend) for seed in seeds} if cache else {}
+    found = {}
+    for seed, key in keys.items():
+        result = cache.get(key)
+        if result is not None:
+            found[seed] = [tuple(counts) for counts in result['series']]
+    missing = [seed for seed in seeds if seed not in found]
+    computed = iter(simulate(size, max_cycles, missing, workers, backend))
+    for seed in seeds:
+        if seed in found:
+            yield seed, found[seed]
+            continue
+        series = next(computed)
+        if keys.get(seed):
+            cache.put(keys[seed], entry(series))
+            found[seed] = series  # semillas repetidas en la misma lista
+        yield seed, series
+
+
+def simulate(size: int, max_cycles: int, seeds: List[int], workers, backend: str) -> Iterator[List[Counts]]:
+    if not seeds:
+        return
+    if backend == 'batched':
+        yield from simulate_batched(size, max_cycles, seeds, workers)
+        return
+    args = ([size] * len(seeds), [max_cycles] * len(seeds), seeds, [backend] * len(seeds))
+    if workers == 1:
+        yield from map(population_series, *args)
+        return
+    chunksize = max(1, len(seeds) // (4 * (workers or os.cpu_count() or 1)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(population_series, *args, chunksize=chunksize)
+
+
+def simulate_batched(size: int, max_cycles: int, seeds: List[int], workers) -> Iterator[List[Counts]]:
+    # Mundos pequeños: un BatchedWorlds por proceso en vez de un Ecosystem por semilla
+    from .BatchedWorlds import batched_series
+    if workers == 1:
+        yield from batched_series(size, max_cycles, seeds)
+        return
+    workers = workers or os.cpu_count() or 1
+    step = -(-len(seeds) // workers)
+    chunks = [seeds[start:start + step] for start in range(0, len(seeds), step)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for series in pool.map(batched_series, [size] * len(chunks), [max_cycles] * len(chunks), chunks):
+            yield from series
+
+
+def quantile(values: List[float], q: float) -> float:
+    # Interpolación lineal entre rangos, como numpy.quantile por defecto
+    ordered = sorted(values)
+    position = q * (len(ordered) - 1)
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def aggregate(series: Iterable[List[Counts]], quantiles=(0.1, 0.5, 0.9)) -> Dict[str, dict]:
+    """Curvas de media y cuantiles por ciclo para cada especie.
+
+    Las simulaciones que terminan antes se prolongan con su último estado.
+    """
+    series = list(series)
+    length = max(len(run) for run in series)
+    padded = [run + [run[-1]] * (length - len(run)) for run in series]
+    curves = {}
+    for index, name in enumerate(SPECIES):
+        per_cycle = [[run[cycle][index] for run in padded] for cycle in range(length)]
+        curves[name] = {
+            'mean': [sum(values) / len(values) for values in per_cycle],
+            'quantiles': {q: [quantile(values, q) for values in per_cycle] for q in quantiles},
+        }
+    return curves
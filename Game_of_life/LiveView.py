@@ -0,0 +1,78 @@
+import sys
+import time
+from multiprocessing import Event, Pipe, Process
+from typing import NamedTuple
+
+from .Ecosystem import Ecosystem
+from .TerminalRenderer import TerminalRenderer
+
+
+# ======================= Vista en vivo =======================
+class Snapshot(NamedTuple):
+    """Copia inmutable de lo que necesita TerminalRenderer."""
+    size: int
+    max_cycles: int
+    cycle_count: int
+    num_plants: int
+    num_prey: int
+    num_predators: int
+    species: bytes
+
+    def species_bytes(self) -> bytes:
+        return self.species
+
+
+def snapshot(eco: Ecosystem) -> Snapshot:
+    return Snapshot(eco.size, eco.max_cycles, eco.cycle_count, eco.num_plants,
+                    eco.num_prey, eco.num_predators, eco.species_bytes())
+
+
+def simulate(size: int, max_cycles: int, seed, backend: str, conn, wanted):
+    # Proceso de simulación: solo copia el estado cuando el visor lo pide
+    eco = Ecosystem(size, max_cycles, iterative=True, backend=backend, seed=seed)
+    conn.send(snapshot(eco))
+    while not eco.is_simulation_over():
+        eco.update_ecosystem()
+        if wanted.is_set():
+            wanted.clear()
+            conn.send(snapshot(eco))
+    conn.send(snapshot(eco))
+    conn.send(None)
+    conn.close()
+
+
+def live_view(size: int, max_cycles: int, seed=None, backend: str = 'objects',
+              fps: float = 30, out=sys.stdout) -> Snapshot:
+    """Simula en otro proceso y dibuja el último estado publicado a `fps` como máximo.
+
+    Los ciclos que ocurren entre dos cuadros no se dibujan, así que la
+    simulación avanza al mismo ritmo se mire o no.
+    """
+    receiver, sender = Pipe(duplex=False)
+    wanted = Event()
+    worker = Process(target=simulate, args=(size, max_cycles, seed, backend, sender, wanted), daemon=True)
+    worker.start()
+    sender.close()
+
+    renderer = TerminalRenderer(out)
+    period = 1 / fps
+    latest = None
+    finished = False
+    while not finished:
+        deadline = time.monotonic() + period
+        wanted.set()
+        while receiver.poll(max(0.0, deadline - time.monotonic())):
+            try:
+                message = receiver.recv()
+            except EOFError:
+                # El proceso de simulación murió sin mandar el mensaje final
+                worker.join()
+                raise RuntimeError(f"la simulación terminó con código de salida {worker.exitcode}") from None
+            if message is None:
+                finished = True
+                break
+            latest = message
+        if latest is not None:
+            renderer.render(latest)
+    worker.join()
+    return latest
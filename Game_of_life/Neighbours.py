@@ -0,0 +1,53 @@
+from array import array
+from functools import lru_cache
+
+DIRECTIONS = ((0, 1), (1, 0), (0, -1), (-1, 0))  # Orden de get_empty_adjacent y first_adjacent
+
+
+# ======================= Tablas de vecinos =======================
+def neighbours_of(size: int, x: int, y: int, wrap: bool = False) -> tuple:
+    # Vecinos de (x, y) en el orden de DIRECTIONS; sin wrap se omiten los de fuera
+    if wrap:
+        return tuple(((x + dx) % size, (y + dy) % size) for dx, dy in DIRECTIONS)
+    return tuple((x + dx, y + dy) for dx, dy in DIRECTIONS if 0 <= x + dx < size and 0 <= y + dy < size)
+
+
+@lru_cache(maxsize=2)
+def neighbour_table(size: int, wrap: bool = False) -> array:
+    """Vecinos de cada celda en un array plano de enteros: 4 entradas por celda.
+
+    Las entradas 4 * c .. 4 * c + 3 son los índices planos (x * size + y) de
+    los vecinos de la celda c en el orden de DIRECTIONS, -1 fuera del mundo.
+    Se calcula una vez por tamaño y la comparten todos los ecosistemas; a
+    16 bytes por celda cabe también en mundos grandes. Con wrap el mundo es
+    un toro.
+    """
+    table = array('i', [-1]) * (4 * size * size)
+    for k, (dx, dy) in enumerate(DIRECTIONS):
+        columns = [(y + dy) % size if wrap else (y + dy if 0 <= y + dy < size else -1) for y in range(size)]
+        values = []
+        for x in range(size):
+            nx = (x + dx) % size if wrap else x + dx
+            if 0 <= nx < size:
+                values.extend(nx * size + ny if ny >= 0 else -1 for ny in columns)
+            else:
+                values.extend([-1] * size)
+        table[k::4] = array('i', values)
+    return table
+
+
+@lru_cache(maxsize=8)
+def neighbour_index(size: int, wrap: bool = False):
+    # Para los backends vectorizados: fila k = índice plano del vecino k de DIRECTIONS, -1 fuera.
+    # Una fila contigua por dirección: first_adjacent indexa una dirección cada vez
+    import numpy as np
+    xs, ys = np.divmod(np.arange(size * size), size)
+    table = np.full((len(DIRECTIONS), size * size), -1, dtype=np.int64)
+    for k, (dx, dy) in enumerate(DIRECTIONS):
+        nx, ny = xs + dx, ys + dy
+        if wrap:
+            nx, ny = nx % size, ny % size
+        inside = (nx >= 0) & (nx < size) & (ny >= 0) & (ny < size)
+        table[k, inside] = (nx * size + ny)[inside]
+    table.flags.writeable = False
+    return table
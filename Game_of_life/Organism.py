@@ -1,10 +1,19 @@
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import List, NamedTuple, Optional, Tuple
 from abc import ABC, abstractmethod
 import random
 import sys
 
 # ======================= Clases Base =======================
+class Intent(NamedTuple):
+    # Lo que un organismo quiere hacer este ciclo en el modo síncrono, decidido sobre
+    # el estado sin modificar; Ecosystem.resolve_intents lo aplica si no hay conflicto
+    organism: 'Organism'
+    birth: Optional[Tuple[int, int]] = None  # Celda para la cría
+    move: Optional[Tuple[int, int]] = None  # Celda a la que moverse
+    prey: Optional['Organism'] = None  # Presa a cazar (el depredador ocupa su celda)
+
+
 @dataclass
 class Organism(ABC):
     x: int
@@ -25,4 +34,4 @@ class Organism(ABC):
 
     @abstractmethod
     def get_symbol(self) -> str:
-        pass
\ No newline at end of file
+        pass
@@ -0,0 +1,43 @@
+from typing import Iterator
+
+from .Organism import Organism
+
+
+# ======================= Registro de organismos =======================
+class OrganismRegistry:
+    """Lista de organismos con alta y baja en O(1).
+
+    Borrar deja una lápida (None) en su hueco, de modo que los índices no se
+    desplazan mientras update_organisms recorre `slots`. compact() elimina
+    las lápidas de una vez al final del ciclo.
+    """
+
+    def __init__(self):
+        self.slots = []
+        self.index = {}  # id(organismo) -> posición en slots
+        self.tombstones = 0
+
+    def __len__(self) -> int:
+        return len(self.slots) - self.tombstones
+
+    def __iter__(self) -> Iterator[Organism]:
+        return (org for org in self.slots if org is not None)
+
+    def __contains__(self, organism: Organism) -> bool:
+        return id(organism) in self.index
+
+    def append(self, organism: Organism):
+        self.index[id(organism)] = len(self.slots)
+        self.slots.append(organism)
+
+    def remove(self, organism: Organism):
+        position = self.index.pop(id(organism))
+        self.slots[position] = None
+        self.tombstones += 1
+
+    def compact(self):
+        if self.tombstones == 0:
+            return
+        self.slots = [org for org in self.slots if org is not None]
+        self.index = {id(org): position for position, org in enumerate(self.slots)}
+        self.tombstones = 0
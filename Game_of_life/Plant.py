@@ -1,3 +1,8 @@
+from dataclasses import dataclass
+
+from .Organism import Organism
+
+
 @dataclass
 class Plant(Organism):
     def update_state(self, ecosystem: 'Ecosystem'):
@@ -7,4 +12,4 @@ class Plant(Organism):
         pass
 
     def get_symbol(self) -> str:
-        return 'H'
\ No newline at end of file
+        return 'H'
@@ -0,0 +1,49 @@
+from typing import Iterator, Tuple
+
+
+# ======================= Plantas como mapa de bits =======================
+class PlantBitmap:
+    """Un bit por celda (índice plano x * size + y): 1 si hay planta.
+
+    Las plantas no hacen nada en su turno, así que no necesitan objeto,
+    registro ni sitio en la cuadrícula; basta con saber dónde están.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.bits = bytearray((size * size + 7) // 8)
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, cell: Tuple[int, int]) -> bool:
+        index = cell[0] * self.size + cell[1]
+        return self.bits[index >> 3] >> (index & 7) & 1 == 1
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for byte_index, byte in enumerate(self.bits):
+            while byte:
+                bit = (byte & -byte).bit_length() - 1
+                yield divmod(byte_index * 8 + bit, self.size)
+                byte &= byte - 1
+
+    def add(self, x: int, y: int) -> bool:
+        # True si la celda no tenía planta
+        index = x * self.size + y
+        mask = 1 << (index & 7)
+        if self.bits[index >> 3] & mask:
+            return False
+        self.bits[index >> 3] |= mask
+        self.count += 1
+        return True
+
+    def discard(self, x: int, y: int) -> bool:
+        # True si la celda tenía planta
+        index = x * self.size + y
+        mask = 1 << (index & 7)
+        if not self.bits[index >> 3] & mask:
+            return False
+        self.bits[index >> 3] &= ~mask
+        self.count -= 1
+        return True
@@ -1,4 +1,8 @@
 from dataclasses import dataclass
+from typing import List, Tuple
+
+from .Organism import Intent, Organism
+from .Prey import Prey
 
 
 @dataclass
@@ -22,6 +26,8 @@ class Predator(Organism):
             self.energy = 0
 
     def find_visible_prey(self, ecosystem: 'Ecosystem') -> List[Tuple[int, int]]:
+        if ecosystem.iterative:
+            return self.find_visible_prey_iterative(ecosystem)
         prey = []
         
         def check_row(y: int):
@@ -44,6 +50,12 @@ class Predator(Organism):
         check_col(0)
         return prey
 
+    def find_visible_prey_iterative(self, ecosystem: 'Ecosystem') -> List[Tuple[int, int]]:
+        row = ecosystem.grid[self.x]
+        prey = [(self.x, y) for y in range(ecosystem.size) if isinstance(row[y], Prey)]
+        prey += [(x, self.y) for x in range(ecosystem.size) if isinstance(ecosystem.grid[x][self.y], Prey)]
+        return prey
+
     def get_closest_prey(self, prey_list: List[Tuple[int, int]]):
         def helper(lst, idx, closest, min_dist):
             if idx >= len(lst):
@@ -55,6 +67,10 @@ class Predator(Organism):
             return helper(lst, idx+1, closest, min_dist)
         return helper(prey_list, 0, None, float('inf'))
 
+    def get_closest_prey_iterative(self, prey_list: List[Tuple[int, int]]):
+        # min() conserva el primer empate, igual que helper
+        return min(prey_list, key=lambda pos: abs(pos[0] - self.x) + abs(pos[1] - self.y), default=None)
+
     def get_direction(self, target: Tuple[int, int]) -> Tuple[int, int]:
         if target[0] != self.x:  # Mover en eje X
             return (1 if target[0] > self.x else -1, 0)
@@ -62,26 +78,60 @@ class Predator(Organism):
             return (0, 1 if target[1] > self.y else -1)
 
     def move(self, ecosystem: 'Ecosystem'):
-        visible_prey = self.find_visible_prey(ecosystem)
-        if visible_prey:
-            closest_pos = self.get_closest_prey(visible_prey)
-            if closest_pos:
-                direction = self.get_direction(closest_pos)
-                new_x = self.x + direction[0]
-                new_y = self.y + direction[1]
-                
-                if 0 <= new_x < ecosystem.size and 0 <= new_y < ecosystem.size:
-                    target = ecosystem.grid[new_x][new_y]
-                    if isinstance(target, Prey):
-                        self.hunt_prey(ecosystem, target)
-                    elif target is None:
-                        ecosystem.move_organism(self, new_x, new_y)
+        # Equivale a get_closest_prey(find_visible_prey(...)) usando el índice
+        closest_pos = ecosystem.prey_index.nearest(self.x, self.y)
+        if closest_pos:
+            direction = self.get_direction(closest_pos)
+            new_x = self.x + direction[0]
+            new_y = self.y + direction[1]
+
+            if 0 <= new_x < ecosystem.size and 0 <= new_y < ecosystem.size:
+                target = ecosystem.grid[new_x][new_y]
+                if isinstance(target, Prey):
+                    self.hunt_prey(ecosystem, target)
+                elif target is None and (new_x, new_y) not in ecosystem.plants:
+                    ecosystem.move_organism(self, new_x, new_y)
         else:
             positions = self.get_empty_adjacent(ecosystem)
             if positions:
                 new_x, new_y = positions[0]
                 ecosystem.move_organism(self, new_x, new_y)
 
+    def intent(self, ecosystem: 'Ecosystem') -> Intent:
+        # Como update_state + move sobre el estado sin modificar
+        positions = self.get_empty_adjacent(ecosystem)
+        birth = None
+        if self.energy >= 50 and positions:
+            birth = positions[0]
+            positions = positions[1:]
+        closest_pos = ecosystem.prey_index.nearest(self.x, self.y)
+        if closest_pos:
+            dx, dy = self.get_direction(closest_pos)
+            new_x, new_y = self.x + dx, self.y + dy
+            target = ecosystem.grid[new_x][new_y]
+            if isinstance(target, Prey):
+                return Intent(self, birth, prey=target)
+            if target is None and (new_x, new_y) not in ecosystem.plants:
+                return Intent(self, birth, (new_x, new_y))
+            return Intent(self, birth)
+        return Intent(self, birth, positions[0] if positions else None)
+
+    def apply_intent(self, ecosystem: 'Ecosystem', intent: Intent, claimed: set, hunters: dict):
+        self.starvation_time += 1
+        if self.starvation_time >= self.max_starvation_time:
+            self.health = 0
+        if intent.birth is not None and intent.birth not in claimed:
+            claimed.add(intent.birth)
+            ecosystem.add_organism(Predator(*intent.birth, 100, 10, 0, self.max_starvation_time))
+            self.energy = 0
+        if intent.prey is not None:
+            if hunters[id(intent.prey)] is self:
+                claimed.add((intent.prey.x, intent.prey.y))
+                self.hunt_prey(ecosystem, intent.prey)
+        elif intent.move is not None and intent.move not in claimed:
+            claimed.add(intent.move)
+            ecosystem.move_organism(self, *intent.move)
+
     def hunt_prey(self, ecosystem: 'Ecosystem', prey: Prey):
         ecosystem.delete_organism(prey)
         self.energy += 10
@@ -89,17 +139,25 @@ class Predator(Organism):
         ecosystem.move_organism(self, prey.x, prey.y)
 
     def get_empty_adjacent(self, ecosystem):
-        return self.check_directions(ecosystem, [(0,1),(1,0),(0,-1),(-1,0)], 0, [])
+        cell = 4 * (self.x * ecosystem.size + self.y)
+        neighbours = ecosystem.neighbours[cell:cell + 4]  # -1 fuera del mundo
+        if ecosystem.iterative:
+            return self.check_directions_iterative(ecosystem, neighbours)
+        return self.check_directions(ecosystem, neighbours, 0, [])
 
-    def check_directions(self, ecosystem, directions, index, acc):
-        if index >= len(directions):
+    def check_directions(self, ecosystem, neighbours, index, acc):
+        if index >= len(neighbours):
             return acc
-        dx, dy = directions[index]
-        nx, ny = self.x + dx, self.y + dy
-        if 0 <= nx < ecosystem.size and 0 <= ny < ecosystem.size:
-            if ecosystem.grid[nx][ny] is None:
-                acc.append((nx, ny))
-        return self.check_directions(ecosystem, directions, index+1, acc)
+        if neighbours[index] >= 0:
+            cell = divmod(neighbours[index], ecosystem.size)
+            if ecosystem.grid[cell[0]][cell[1]] is None and cell not in ecosystem.plants:
+                acc.append(cell)
+        return self.check_directions(ecosystem, neighbours, index+1, acc)
+
+    def check_directions_iterative(self, ecosystem, neighbours):
+        grid, plants, size = ecosystem.grid, ecosystem.plants, ecosystem.size
+        cells = [divmod(cell, size) for cell in neighbours if cell >= 0]
+        return [cell for cell in cells if grid[cell[0]][cell[1]] is None and cell not in plants]
 
     def get_symbol(self) -> str:
         return 'L'
@@ -1,3 +1,9 @@
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from .Organism import Intent, Organism
+
+
 @dataclass
 class Prey(Organism):
     def update_state(self, ecosystem: 'Ecosystem'):
@@ -14,24 +20,55 @@ class Prey(Organism):
         positions = self.get_empty_adjacent(ecosystem)
         if positions:
             new_x, new_y = positions[0]
-            target = ecosystem.grid[new_x][new_y]
-            if isinstance(target, Plant):
-                ecosystem.delete_organism(target)
+            if (new_x, new_y) in ecosystem.plants:
+                ecosystem.remove_plant(new_x, new_y)
                 self.energy += 10
             ecosystem.move_organism(self, new_x, new_y)
 
+    def intent(self, ecosystem: 'Ecosystem') -> Intent:
+        # Mismas reglas que update_state + move, sin escribir nada: la cría se queda
+        # la primera celda libre y el movimiento la siguiente
+        positions = self.get_empty_adjacent(ecosystem)
+        birth = None
+        if ecosystem.num_plants >= ecosystem.num_prey + 2 and positions:
+            birth = positions[0]
+            positions = positions[1:]
+        return Intent(self, birth, positions[0] if positions else None)
+
+    def apply_intent(self, ecosystem: 'Ecosystem', intent: Intent, claimed: set, hunters: dict):
+        if id(self) in hunters:
+            return  # Cazada en este mismo ciclo
+        if intent.birth is not None and intent.birth not in claimed:
+            claimed.add(intent.birth)
+            ecosystem.add_organism(Prey(*intent.birth, 100, 0))
+        if intent.move is not None and intent.move not in claimed:
+            claimed.add(intent.move)
+            if intent.move in ecosystem.plants:
+                ecosystem.remove_plant(*intent.move)
+                self.energy += 10
+            ecosystem.move_organism(self, *intent.move)
+
     def get_empty_adjacent(self, ecosystem: 'Ecosystem') -> List[Tuple[int, int]]:
-        return self.check_directions(ecosystem, [(0,1),(1,0),(0,-1),(-1,0)], 0, [])
+        # Vecinos ya recortados a los bordes (o envueltos): las entradas -1 son de fuera
+        cell = 4 * (self.x * ecosystem.size + self.y)
+        neighbours = ecosystem.neighbours[cell:cell + 4]
+        if ecosystem.iterative:
+            return self.check_directions_iterative(ecosystem, neighbours)
+        return self.check_directions(ecosystem, neighbours, 0, [])
 
-    def check_directions(self, ecosystem, directions, index, acc):
-        if index >= len(directions):
+    def check_directions(self, ecosystem, neighbours, index, acc):
+        if index >= len(neighbours):
             return acc
-        dx, dy = directions[index]
-        nx, ny = self.x + dx, self.y + dy
-        if 0 <= nx < ecosystem.size and 0 <= ny < ecosystem.size:
-            if ecosystem.grid[nx][ny] is None or isinstance(ecosystem.grid[nx][ny], Plant):
+        if neighbours[index] >= 0:
+            nx, ny = divmod(neighbours[index], ecosystem.size)
+            if ecosystem.grid[nx][ny] is None:  # Vacía o con planta (las plantas no están en grid)
                 acc.append((nx, ny))
-        return self.check_directions(ecosystem, directions, index+1, acc)
+        return self.check_directions(ecosystem, neighbours, index+1, acc)
+
+    def check_directions_iterative(self, ecosystem, neighbours):
+        grid, size = ecosystem.grid, ecosystem.size
+        cells = [divmod(cell, size) for cell in neighbours if cell >= 0]
+        return [cell for cell in cells if grid[cell[0]][cell[1]] is None]
 
     def get_symbol(self) -> str:
         return 'C'
@@ -0,0 +1,46 @@
+import numpy as np
+
+# Paso hacia la presa por código de dirección; -1 (sin presa a la vista) indexa el último
+STEPS = np.array([(0, -1), (0, 1), (-1, 0), (1, 0), (0, 0)], dtype=np.int64)
+
+
+# ======================= Campo de presas =======================
+def distances_along(mask: np.ndarray, far: int, axis: int):
+    # Barrido por filas (axis=-1) o columnas (axis=-2): distancia a la presa más
+    # cercana hacia atrás y hacia delante; sin presa, far o más
+    index = np.arange(mask.shape[axis], dtype=np.int32)
+    if axis == -2:
+        index = index[:, None]
+    back = np.maximum.accumulate(np.where(mask, index, -far), axis=axis)
+    ahead = np.flip(np.where(mask, index, len(index) - 1 + far), axis)
+    ahead = np.flip(np.minimum.accumulate(ahead, axis=axis), axis)
+    return index - back, ahead - index
+
+
+def prey_field(is_prey: np.ndarray, above: np.ndarray = None, below: np.ndarray = None,
+               row0: int = 0) -> np.ndarray:
+    """Dirección hacia la presa visible más cercana desde cada celda (códigos de STEPS).
+
+    Cuatro barridos por filas y columnas sobre (..., H, W) construyen el campo
+    una vez por ciclo; cada depredador solo lee su celda. Desempate como
+    find_visible_prey + get_closest_prey: izquierda, derecha, arriba, abajo.
+    En una franja, row0 es su primera fila global y above/below dan por
+    columna la fila global de la presa más cercana fuera de ella (-1 si no hay).
+    """
+    height, width = is_prey.shape[-2:]
+    far = 2 * (row0 + height + width) + 1  # Mayor que cualquier distancia real
+    left, right = distances_along(is_prey, far, axis=-1)
+    up, down = distances_along(is_prey, far, axis=-2)
+    if above is not None:
+        # Hacia fuera de la franja solo si dentro de ella no hay presa en la columna
+        rows = np.arange(height, dtype=np.int32)[:, None] + row0
+        up = np.where(up < far, up, np.where(above >= 0, rows - above, far))
+        down = np.where(down < far, down, np.where(below >= 0, below - rows, far))
+    # Comparación estricta: en empate gana la primera dirección, en el orden de STEPS
+    field = np.zeros(is_prey.shape, dtype=np.int8)
+    best = left
+    for code, distance in enumerate((right, up, down), start=1):
+        field[distance < best] = code
+        best = np.minimum(best, distance)
+    field[best >= far] = -1
+    return field
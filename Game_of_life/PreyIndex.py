@@ -0,0 +1,42 @@
+from bisect import bisect_left, insort
+from typing import Optional, Tuple
+
+
+# ======================= Índice de presas por fila y columna =======================
+class PreyIndex:
+    """Posiciones de presas ordenadas por fila (columnas y) y por columna (filas x).
+
+    nearest() encuentra la presa visible más cercana con dos bisecciones, con
+    el mismo desempate que find_visible_prey + get_closest_prey: primero la
+    fila (de menor a mayor y) y luego la columna (de menor a mayor x).
+    """
+
+    def __init__(self, size: int):
+        self.rows = [[] for _ in range(size)]
+        self.cols = [[] for _ in range(size)]
+
+    def add(self, x: int, y: int):
+        insort(self.rows[x], y)
+        insort(self.cols[y], x)
+
+    def remove(self, x: int, y: int):
+        row = self.rows[x]
+        del row[bisect_left(row, y)]
+        col = self.cols[y]
+        del col[bisect_left(col, x)]
+
+    def nearest(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        closest, min_dist = None, float('inf')
+        row = self.rows[x]
+        i = bisect_left(row, y)
+        for other in row[max(i - 1, 0):i + 1]:
+            dist = abs(other - y)
+            if 0 < dist < min_dist:
+                closest, min_dist = (x, other), dist
+        col = self.cols[y]
+        i = bisect_left(col, x)
+        for other in col[max(i - 1, 0):i + 1]:
+            dist = abs(other - x)
+            if 0 < dist < min_dist:
+                closest, min_dist = (other, y), dist
+        return closest
@@ -0,0 +1,182 @@
+from collections import defaultdict
+from time import perf_counter_ns
+from typing import Dict, List
+
+from .Predator import Predator
+from .Prey import Prey
+from .TerminalRenderer import TerminalRenderer
+
+# Métodos medidos. Los del ecosistema se envuelven en la instancia (si el
+# backend los tiene); los de las especies y el renderer, en la clase mientras
+# dure la medición, porque los organismos nacen y mueren a cada ciclo.
+ECOSYSTEM_PHASES = (
+    'regenerate_plants', 'update_organisms', 'resolve_intents', 'reap', 'print_grid',
+    'add_organism', 'delete_organism', 'move_organism',
+    # ArrayEcosystem
+    'place', 'update_prey', 'update_predators', 'hunting_targets', 'count_organisms',
+    # TiledEcosystem
+    'exchange_halos', 'column_vision', 'phase', 'prey_births',
+)
+CLASS_PHASES = (
+    (Prey, ('update_state', 'reproduces', 'move', 'intent')),
+    (Predator, ('update_state', 'reproduces', 'move', 'intent', 'hunt_prey')),
+    (TerminalRenderer, ('render',)),
+)
+
+
+def neighbour_count(cls, organism, ecosystem) -> int:
+    # Vecinos que mira get_empty_adjacent: en los bordes sin wrap son menos de 4
+    cell = 4 * (organism.x * ecosystem.size + organism.y)
+    return sum(neighbour >= 0 for neighbour in ecosystem.neighbours[cell:cell + 4])
+
+
+# Contadores: (dueño, método, contador, incremento por llamada o función(dueño, *argumentos))
+COUNTERS = (
+    (Prey, 'get_empty_adjacent', 'neighbour_checks', neighbour_count),
+    (Predator, 'get_empty_adjacent', 'neighbour_checks', neighbour_count),
+    ('empty_cells', 'sample', 'empty_samples', 1),
+    # ArrayEcosystem: barridos de la cuadrícula entera (celdas libres, campo de presas)
+    ('arrays', 'place', 'grid_scans', 1),
+    ('arrays', 'hunting_targets', 'grid_scans', 1),
+    ('prey_index', 'nearest', 'index_queries', 1),
+    ('organisms', 'remove', 'list_removals', 1),
+    # Solo las colas con lápidas se compactan de verdad
+    ('organisms', 'compact', 'compactions',
+     lambda schedule: sum(queue.tombstones > 0 for queue in schedule.queues.values())),
+)
+MISSING = object()
+
+
+# ======================= Perfilado por fases =======================
+class Profiler:
+    """Tiempo por fase y por método de especie, y contadores del camino caliente.
+
+    Se activa con Ecosystem.start_profiling(): envuelve los métodos medidos y
+    los restaura en stop(), así que desactivado no cuesta nada. Solo puede
+    haber uno activo por proceso, ya que parchea clases compartidas.
+    """
+
+    active = None
+
+    def __init__(self, ecosystem: 'Ecosystem'):
+        if Profiler.active is not None:
+            raise RuntimeError("ya hay un Profiler activo en este proceso")
+        Profiler.active = self
+        self.stack = []  # [nombre, ns de los hijos]
+        self.collapsed = defaultdict(int)  # pila 'a;b;c' -> ns propios
+        self.phases = defaultdict(int)  # ciclo en curso: nombre -> ns inclusivos
+        self.counters = defaultdict(int)
+        self.cycles: List[dict] = []
+        self.patches = []
+        self.install(ecosystem)
+
+    # ---------------------- Parcheo ----------------------
+    def install(self, ecosystem: 'Ecosystem'):
+        owners = {'ecosystem': ecosystem, 'organisms': getattr(ecosystem, 'organisms', None),
+                  'prey_index': getattr(ecosystem, 'prey_index', None),
+                  'empty_cells': getattr(ecosystem, 'empty_cells', None),
+                  # Ecosystem.place no barre nada: solo cuenta en los backends vectorizados
+                  'arrays': ecosystem if hasattr(ecosystem, 'hunting_targets') else None}
+        for cls, names in CLASS_PHASES:
+            for name in names:
+                self.patch(cls, name, self.timed(f"{cls.__name__}.{name}", getattr(cls, name)))
+        prefix = type(ecosystem).__name__
+        for name in ECOSYSTEM_PHASES:
+            if hasattr(ecosystem, name):
+                self.patch(ecosystem, name, self.timed(f"{prefix}.{name}", getattr(ecosystem, name)))
+        for owner, name, counter, step in COUNTERS:
+            owner = owners[owner] if isinstance(owner, str) else owner
+            if owner is not None and hasattr(owner, name):
+                self.patch(owner, name, self.counted(counter, step, getattr(owner, name), owner))
+        cycle = self.timed(f"{prefix}.update_ecosystem", ecosystem.update_ecosystem)
+
+        def update_ecosystem():
+            cycle()
+            self.end_cycle(ecosystem.cycle_count)
+        self.patch(ecosystem, 'update_ecosystem', update_ecosystem)
+
+    def patch(self, owner, name: str, wrapper):
+        # Se guarda lo que había en el propio objeto para poder restaurarlo tal cual
+        self.patches.append((owner, name, vars(owner).get(name, MISSING)))
+        setattr(owner, name, wrapper)
+
+    def stop(self):
+        for owner, name, original in reversed(self.patches):
+            if original is MISSING:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+        self.patches = []
+        Profiler.active = None
+
+    # ---------------------- Envoltorios ----------------------
+    def timed(self, name: str, function):
+        stack, collapsed, phases = self.stack, self.collapsed, self.phases
+
+        def wrapper(*args, **kwargs):
+            if stack and stack[-1][0] == name:  # recursión: un solo marco
+                return function(*args, **kwargs)
+            frame = [name, 0]
+            stack.append(frame)
+            start = perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = perf_counter_ns() - start
+                stack.pop()
+                path = ';'.join([f[0] for f in stack] + [name])
+                collapsed[path] += elapsed - frame[1]
+                if stack:
+                    stack[-1][1] += elapsed
+                if all(f[0] != name for f in stack):
+                    phases[name] += elapsed
+        return wrapper
+
+    def counted(self, counter: str, step, function, owner):
+        counters = self.counters
+        depth = 0
+
+        def wrapper(*args, **kwargs):
+            # Las versiones recursivas cuentan una vez por llamada externa
+            nonlocal depth
+            if depth == 0:
+                counters[counter] += step(owner, *args, **kwargs) if callable(step) else step
+            depth += 1
+            try:
+                return function(*args, **kwargs)
+            finally:
+                depth -= 1
+        return wrapper
+
+    def end_cycle(self, cycle_count: int):
+        self.cycles.append({'cycle': cycle_count, 'phases': dict(self.phases),
+                            'counters': dict(self.counters)})
+        self.phases.clear()
+        self.counters.clear()
+
+    # ---------------------- Salida ----------------------
+    def totals(self) -> Dict[str, int]:
+        totals = defaultdict(int)
+        for row in self.cycles:
+            for name, value in row['phases'].items():
+                totals[name] += value
+        return dict(totals)
+
+    def write_table(self, out):
+        # Una fila por ciclo: ms inclusivos por fase y contadores
+        totals = self.totals()
+        phases = sorted(totals, key=totals.get, reverse=True)
+        counters = sorted({name for row in self.cycles for name in row['counters']})
+        out.write('\t'.join(['cycle'] + phases + counters) + '\n')
+        for row in self.cycles:
+            cells = [str(row['cycle'])]
+            cells += [f"{row['phases'].get(name, 0) / 1e6:.3f}" for name in phases]
+            cells += [str(row['counters'].get(name, 0)) for name in counters]
+            out.write('\t'.join(cells) + '\n')
+
+    def write_collapsed(self, path: str):
+        # Formato de flamegraph.pl / speedscope: 'a;b;c <µs propios>'
+        with open(path, 'w') as f:
+            for stack, ns in sorted(self.collapsed.items()):
+                if ns >= 1000:
+                    f.write(f"{stack} {ns // 1000}\n")
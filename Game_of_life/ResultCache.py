@@ -0,0 +1,110 @@
+import hashlib
+import json
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+@lru_cache(maxsize=None)
+def code_version() -> str:
+    # Cualquier cambio en el código del paquete invalida los resultados guardados
+    digest = hashlib.sha256()
+    for path in sorted(Path(__file__).parent.glob('*.py')):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def rules_of(backend: str) -> str:
+    # tiled y batched reproducen exactamente a numpy: comparten resultados
+    return 'numpy' if backend in ('tiled', 'batched') else backend
+
+
+def entry(series: list, elapsed: float = None) -> dict:
+    # Lo que se guarda por simulación: serie (plantas, presas, depredadores) desde el ciclo 0
+    plants, prey, predators = series[-1]
+    return {'cycles': len(series) - 1, 'num_plants': plants, 'num_prey': prey, 'num_predators': predators,
+            'elapsed': elapsed, 'series': [list(counts) for counts in series]}
+
+
+# ======================= Caché de resultados =======================
+class ResultCache:
+    """Resultados de simulaciones en disco, direccionados por el hash de su configuración.
+
+    Un archivo JSON por clave (contadores finales y serie de poblaciones por
+    ciclo). Al leer se actualiza la fecha del archivo y, si el directorio pasa
+    de max_bytes, se borran primero los menos usados. Sin semilla no hay
+    resultado reproducible, así que no se guarda nada.
+    """
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        # Total en bytes del directorio: se recorre una vez aquí y luego se lleva la cuenta
+        self.total = sum(size for _, size, _ in self.entries())
+
+    @staticmethod
+    def key(size: int, max_cycles: int, seed, backend: str = 'objects', **options) -> Optional[str]:
+        if seed is None:
+            return None
+        config = {'size': size, 'max_cycles': max_cycles, 'seed': seed, 'rules': rules_of(backend),
+                  'options': options, 'code': code_version()}
+        return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: Optional[str]) -> Optional[dict]:
+        if key is None:
+            return None
+        file = self.path / f"{key}.json"
+        try:
+            with open(file) as f:
+                result = json.load(f)
+            os.utime(file)
+        except (OSError, ValueError):
+            return None
+        return result
+
+    def put(self, key: Optional[str], result: dict):
+        if key is None:
+            return
+        file = self.path / f"{key}.json"
+        try:
+            replaced = file.stat().st_size
+        except OSError:
+            replaced = 0
+        # Escritura atómica: otros procesos del mismo barrido pueden leer a la vez
+        fd, temporary = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(result, f, separators=(',', ':'))
+            written = f.tell()
+        os.replace(temporary, file)
+        self.total += written - replaced
+        if self.total > self.max_bytes:
+            self.evict()
+
+    def entries(self) -> list:
+        found = []
+        for file in self.path.glob('*.json'):
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+            found.append((stat.st_mtime, stat.st_size, file))
+        return found
+
+    def evict(self):
+        # Solo al pasar de max_bytes; se recuenta el directorio por si otros procesos escriben en él
+        entries = self.entries()
+        self.total = sum(size for _, size, _ in entries)
+        for _, size, file in sorted(entries, key=lambda entry: entry[0]):
+            if self.total <= self.max_bytes:
+                break
+            try:
+                file.unlink()
+            except OSError:
+                pass
+            self.total -= size
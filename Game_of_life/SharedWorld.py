@@ -0,0 +1,120 @@
+from multiprocessing import resource_tracker, shared_memory
+from typing import NamedTuple
+
+import numpy as np
+
+# Segmento compartido:
+#   cabecera int64[4]: size, max_cycles, seq, reservado
+#   2 búferes, cada uno: int64[4] (cycle_count, plantas, presas, depredadores),
+#   species int8, health int16, energy int32, starvation_time int32 (size² cada uno)
+# seq es par cuando no se escribe; el cuadro f = seq // 2 vive en el búfer f % 2,
+# así que el escritor siempre escribe en el búfer que no están leyendo.
+HEADER = 4
+FIELDS = (('species', np.int8), ('health', np.int16), ('energy', np.int32), ('starvation_time', np.int32))
+
+
+def align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def buffer_size(size: int) -> int:
+    total = 8 * 4
+    for _, dtype in FIELDS:
+        total = align(total + size * size * np.dtype(dtype).itemsize)
+    return total
+
+
+class Frame(NamedTuple):
+    """Vistas sin copia de un cuadro publicado; válidas mientras is_intact()."""
+    seq: int
+    cycle_count: int
+    num_plants: int
+    num_prey: int
+    num_predators: int
+    species: np.ndarray
+    health: np.ndarray
+    energy: np.ndarray
+    starvation_time: np.ndarray
+
+
+def views(memory, size: int):
+    header = np.ndarray((HEADER,), np.int64, memory.buf, 0)
+    buffers = []
+    for index in range(2):
+        offset = 8 * HEADER + index * buffer_size(size)
+        buffer = {'meta': np.ndarray((4,), np.int64, memory.buf, offset)}
+        offset += 8 * 4
+        for name, dtype in FIELDS:
+            buffer[name] = np.ndarray((size, size), dtype, memory.buf, offset)
+            offset = align(offset + size * size * np.dtype(dtype).itemsize)
+        buffers.append(buffer)
+    return header, buffers
+
+
+# ======================= Escritor =======================
+class SharedWorld:
+    """Publica el estado de un ArrayEcosystem en memoria compartida con doble búfer."""
+
+    def __init__(self, ecosystem: 'ArrayEcosystem', name: str = None):
+        size = ecosystem.size
+        self.memory = shared_memory.SharedMemory(name, create=True, size=8 * HEADER + 2 * buffer_size(size))
+        self.name = self.memory.name
+        self.header, self.buffers = views(self.memory, size)
+        self.header[:] = (size, ecosystem.max_cycles, -2, 0)
+        self.publish(ecosystem)
+
+    def publish(self, ecosystem: 'ArrayEcosystem'):
+        seq = int(self.header[2]) + 2
+        buffer = self.buffers[(seq // 2) % 2]
+        self.header[2] = seq - 1  # impar: escribiendo el búfer trasero
+        buffer['meta'][:] = (ecosystem.cycle_count, ecosystem.num_plants, ecosystem.num_prey,
+                             ecosystem.num_predators)
+        for name, _ in FIELDS:
+            np.copyto(buffer[name], getattr(ecosystem, name))
+        self.header[2] = seq
+
+    def close(self):
+        self.header = self.buffers = None
+        self.memory.close()
+        self.memory.unlink()
+
+
+# ======================= Lector =======================
+class SharedWorldReader:
+    """Se engancha a un SharedWorld por nombre desde cualquier proceso."""
+
+    def __init__(self, name: str):
+        # El segmento es del escritor: el lector no debe registrarlo en el
+        # resource_tracker, que lo borraría al terminar (track=False en Python 3.13+)
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args: None
+        try:
+            self.memory = shared_memory.SharedMemory(name)
+        finally:
+            resource_tracker.register = register
+        self.size = int(np.ndarray((HEADER,), np.int64, self.memory.buf, 0)[0])
+        self.header, self.buffers = views(self.memory, self.size)
+        self.max_cycles = int(self.header[1])
+
+    def latest(self) -> Frame:
+        seq = int(self.header[2]) & ~1
+        buffer = self.buffers[(seq // 2) % 2]
+        cycle, plants, prey, predators = (int(value) for value in buffer['meta'])
+        return Frame(seq, cycle, plants, prey, predators,
+                     *(buffer[name] for name, _ in FIELDS))
+
+    def is_intact(self, frame: Frame) -> bool:
+        # El búfer del cuadro solo se reescribe cuando empieza la publicación seq + 3
+        return int(self.header[2]) < frame.seq + 3
+
+    def read(self, reader):
+        # Aplica reader(frame) y reintenta si el escritor pisó el cuadro mientras tanto
+        while True:
+            frame = self.latest()
+            result = reader(frame)
+            if self.is_intact(frame):
+                return result
+
+    def close(self):
+        self.header = self.buffers = None
+        self.memory.close()
@@ -0,0 +1,208 @@
+import random
+from typing import List, Tuple
+
+from .Ecosystem import Ecosystem
+from .Neighbours import neighbours_of
+from .Plant import Plant
+from .Predator import Predator
+from .Prey import Prey
+from .PreyIndex import PreyIndex
+from .Species import PLANT, code_of
+
+
+# ======================= Cuadrícula dispersa =======================
+class SparseRow(dict):
+    """Fila de SparseGrid: columna -> organismo, solo celdas ocupadas."""
+
+    def __init__(self, grid: 'SparseGrid', x: int):
+        super().__init__()
+        self.grid = grid
+        self.x = x
+
+    def __missing__(self, y: int):
+        return None
+
+    def __setitem__(self, y: int, organism):
+        if organism is None:
+            if self.pop(y, None) is not None:
+                self.grid.occupied -= 1
+                if not self:
+                    self.grid.pop(self.x, None)
+            return
+        if y not in self:
+            self.grid.occupied += 1
+            if self.x not in self.grid:
+                dict.__setitem__(self.grid, self.x, self)
+        dict.__setitem__(self, y, organism)
+
+
+class SparseGrid(dict):
+    """Sustituto de la lista de listas: grid[x][y] funciona igual y vale None si está vacía.
+
+    Solo se guardan las filas con algún organismo; leer una fila vacía
+    devuelve una fila nueva que se engancha al escribir en ella.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.occupied = 0
+
+    def __missing__(self, x: int) -> SparseRow:
+        return SparseRow(self, x)
+
+
+class SparseEmptyCells:
+    """Misma interfaz que EmptyCells, calculada a partir de la cuadrícula.
+
+    No guarda las celdas libres: sample() sortea celdas al azar y descarta las
+    ocupadas, y solo recorre el mundo entero cuando quedan pocas libres.
+    """
+
+    def __init__(self, size: int, grid: SparseGrid, plants: 'SparsePlants'):
+        self.size = size
+        self.grid = grid
+        self.plants = plants
+
+    def __len__(self) -> int:
+        return self.size * self.size - self.grid.occupied - len(self.plants)
+
+    def __contains__(self, cell: Tuple[int, int]) -> bool:
+        return self.grid[cell[0]][cell[1]] is None and cell not in self.plants
+
+    def add(self, x: int, y: int):
+        pass  # La cuadrícula ya refleja el cambio
+
+    def discard(self, x: int, y: int):
+        pass
+
+    def sample(self, k: int, rng: random.Random) -> List[Tuple[int, int]]:
+        k = min(k, len(self))
+        if 2 * k > len(self):
+            free = [(x, y) for x in range(self.size) for y in range(self.size) if (x, y) in self]
+            return rng.sample(free, k)
+        chosen = {}
+        while len(chosen) < k:
+            cell = divmod(rng.randrange(self.size * self.size), self.size)
+            if cell in self:
+                chosen[cell] = None
+        return list(chosen)
+
+
+class SparsePlants(set):
+    # Interfaz de PlantBitmap sobre un conjunto de coordenadas
+    def add(self, x: int, y: int) -> bool:
+        if (x, y) in self:
+            return False
+        super().add((x, y))
+        return True
+
+    def discard(self, x: int, y: int) -> bool:
+        if (x, y) not in self:
+            return False
+        super().discard((x, y))
+        return True
+
+
+class Lines(dict):
+    # Una fila o columna sin presas se lee como vacía sin llegar a crearse
+    def __missing__(self, key: int):
+        return ()
+
+
+class SparseNeighbours:
+    # Se lee como neighbour_table (neighbours[4 * c:4 * c + 4]) sin su tabla de 4·size²
+    # entradas: se calcula al leer y omite los vecinos de fuera en vez de marcarlos con -1
+    def __init__(self, size: int, wrap: bool):
+        self.size = size
+        self.wrap = wrap
+
+    def __getitem__(self, cells: slice) -> list:
+        x, y = divmod(cells.start // 4, self.size)
+        return [nx * self.size + ny for nx, ny in neighbours_of(self.size, x, y, self.wrap)]
+
+
+class SparsePreyIndex(PreyIndex):
+    # Filas y columnas en diccionarios: solo existen las que tienen presas
+    def __init__(self, size: int):
+        self.rows = Lines()
+        self.cols = Lines()
+
+    def add(self, x: int, y: int):
+        self.rows.setdefault(x, [])
+        self.cols.setdefault(y, [])
+        super().add(x, y)
+
+    def remove(self, x: int, y: int):
+        super().remove(x, y)
+        if not self.rows[x]:
+            del self.rows[x]
+        if not self.cols[y]:
+            del self.cols[y]
+
+
+# ======================= Ecosistema disperso =======================
+class SparseEcosystem(Ecosystem):
+    """Backend de objetos que solo guarda las celdas ocupadas.
+
+    Mismas reglas y misma API que Ecosystem (grid[x][y], empty_cells,
+    prey_index...), pero memoria y coste por ciclo dependen de la población y
+    no del área. `density` escala las poblaciones iniciales y la regeneración
+    de plantas (1.0 = 33% / 20% / 10% y size²/6), lo que permite mundos
+    enormes y casi vacíos.
+    """
+
+    def __init__(self, size: int, max_cycles: int, iterative: bool = False, *, backend: str = 'sparse',
+                 density: float = 1.0, **options):
+        self.density = density
+        super().__init__(size, max_cycles, iterative, backend=backend, **options)
+
+    def create_matrix(self, rows: int, cols: int, matrix=None):
+        return SparseGrid()
+
+    def create_neighbours(self, size: int, wrap: bool):
+        return SparseNeighbours(size, wrap)
+
+    def create_plants(self):
+        return SparsePlants()
+
+    def create_empty_cells(self):
+        return SparseEmptyCells(self.size, self.grid, self.plants)
+
+    def create_prey_index(self):
+        return SparsePreyIndex(self.size)
+
+    def initialize_organisms(self):
+        total = self.size ** 2
+        plants = int(total // 3 * self.density)
+        prey = int(total // 5 * self.density)
+        predators = int(total // 10 * self.density)
+        self.add_organisms(plants, Plant, self.empty_cells.sample(plants, self.rng))
+        self.add_organisms(prey, Prey, self.empty_cells.sample(prey, self.rng))
+        self.add_organisms(predators, Predator, self.empty_cells.sample(predators, self.rng))
+
+    def regenerate_plants(self):
+        if len(self.empty_cells) == 0 or self.cycle_count == 0:
+            return
+        num = min(len(self.empty_cells), int((self.size ** 2) // 6 * self.density))
+        self.add_organisms(num, Plant, self.empty_cells.sample(num, self.rng))
+
+    def get_empty_cells_iterative(self, acc: list):
+        for x in range(self.size):
+            for y in range(self.size):
+                if (x, y) in self.empty_cells:
+                    acc.append((x, y))
+        self.rng.shuffle(acc)
+        return acc
+
+    def species_bytes(self) -> bytes:
+        cells = bytearray(self.size * self.size)
+        for x, row in self.grid.items():
+            for y, organism in row.items():
+                cells[x * self.size + y] = code_of(organism)
+        for x, y in self.plants:
+            cells[x * self.size + y] = PLANT
+        return bytes(cells)
+
+    def memory_gauges(self) -> dict:
+        return {'organism_slots': self.organisms.slot_count(), 'occupied_cells': self.grid.occupied,
+                'grid_rows': len(self.grid), 'plants': len(self.plants)}
@@ -0,0 +1,18 @@
+from .Plant import Plant
+from .Prey import Prey
+from .Predator import Predator
+
+# Códigos de especie por celda (backend numpy y checkpoints)
+EMPTY = 0
+PLANT = 1
+PREY = 2
+PREDATOR = 3
+
+SYMBOLS = ('.', 'H', 'C', 'L')  # Indexado por código, como get_symbol()
+
+CODES = {Plant: PLANT, Prey: PREY, Predator: PREDATOR}
+CLASSES = {code: cls for cls, code in CODES.items()}
+
+
+def code_of(organism) -> int:
+    return CODES[type(organism)] if organism is not None else EMPTY
@@ -0,0 +1,64 @@
+import sys
+
+from .Species import SYMBOLS
+
+
+# ======================= Renderizado en terminal =======================
+class TerminalRenderer:
+    """Dibuja el ecosistema redibujando solo las celdas que cambiaron.
+
+    Guarda el cuadro anterior como bytes de especie (species_bytes) y las
+    celdas que quedaron en rojo, y emite cada cuadro con un único write
+    usando posicionamiento de cursor ANSI.
+    """
+
+    def __init__(self, out=sys.stdout):
+        self.out = out
+        self.previous = None
+        self.highlighted = {}  # fila -> columnas dibujadas en rojo
+
+    def render(self, ecosystem: 'Ecosystem'):
+        size = ecosystem.size
+        frame = ecosystem.species_bytes()
+        if self.previous is None or len(self.previous) != len(frame):
+            parts = ["\033[H\033[2J"]
+            for start in range(0, size * size, size):
+                parts.append(' '.join(SYMBOLS[code] for code in frame[start:start + size]) + " \n")
+            self.highlighted = {}
+        else:
+            parts = []
+            highlighted = {}
+            for x in range(size):
+                start = x * size
+                row, old = frame[start:start + size], self.previous[start:start + size]
+                red = {y for y in range(size) if row[y] != old[y]} if row != old else set()
+                # Las celdas rojas del cuadro anterior vuelven a su color aunque no cambien
+                redraw = red | self.highlighted.get(x, set())
+                if redraw:
+                    parts.append(f"\033[{x + 1};{2 * min(redraw) + 1}H")
+                    parts.append(self.span(row, min(redraw), max(redraw), red))
+                if red:
+                    highlighted[x] = red
+            self.highlighted = highlighted
+
+        parts.append(f"\033[{size + 1};1H\033[K"
+                     f"Plantas: {ecosystem.num_plants} | Presas: {ecosystem.num_prey} | "
+                     f"Depredadores: {ecosystem.num_predators}\n\033[K"
+                     f"Ciclo: {ecosystem.cycle_count}/{ecosystem.max_cycles}\n\033[K")
+        self.out.write(''.join(parts))
+        self.out.flush()
+        self.previous = frame
+
+    def span(self, row: bytes, first: int, last: int, red: set) -> str:
+        # Tramo first..last de una fila, cambiando de color solo en los bordes
+        parts = []
+        in_red = False
+        for y in range(first, last + 1):
+            if (y in red) != in_red:
+                in_red = not in_red
+                parts.append("\033[91m" if in_red else "\033[0m")
+            parts.append(SYMBOLS[row[y]])
+            parts.append(' ')
+        if in_red:
+            parts.append("\033[0m")
+        return ''.join(parts)
@@ -0,0 +1,466 @@
+import weakref
+from multiprocessing import Pipe, Process
+
+import numpy as np
+
+from .ArrayEcosystem import ArrayEcosystem
+from .Ecosystem import Ecosystem
+from .Neighbours import neighbour_index
+from .PreyField import STEPS, prey_field
+from .Species import EMPTY, PLANT, PREY, PREDATOR
+
+OUTSIDE = -1  # Código de las filas halo que caen fuera del mundo
+MOVES = ('prey_move', 'pred_move')
+
+
+# ======================= Franja del mundo =======================
+class Tile:
+    """Franja horizontal de filas [row0, row0 + rows) con una fila halo arriba y abajo.
+
+    Los índices locales son planos sobre la franja extendida (rows + 2 filas);
+    global = local + offset. Las decisiones cuyo destino cae en filas
+    interiores se resuelven aquí mismo; las que tocan el borde o el halo se
+    devuelven al coordinador para que las resuelva la franja dueña.
+    """
+
+    def __init__(self, size: int, row0: int, species, health, energy, starvation_time,
+                 max_starvation_time: int):
+        self.size = size
+        self.row0 = row0
+        self.rows = len(species)
+        self.offset = (row0 - 1) * size
+        self.max_starvation_time = max_starvation_time
+        shape = (self.rows + 2, size)
+        self.species = np.full(shape, OUTSIDE, dtype=np.int8)
+        self.health = np.zeros(shape, dtype=np.int16)
+        self.energy = np.zeros(shape, dtype=np.int32)
+        self.starvation_time = np.zeros(shape, dtype=np.int32)
+        for array, values in ((self.species, species), (self.health, health),
+                              (self.energy, energy), (self.starvation_time, starvation_time)):
+            array[1:-1] = values
+        # Filas de neighbour_index de las celdas interiores, en índices locales (-1 fuera del mundo)
+        table = neighbour_index(size)[:, row0 * size:(row0 + self.rows) * size]
+        self.neighbours = np.where(table >= 0, table - self.offset, -1)
+        self.predators = np.zeros(0, dtype=np.int64)
+        self.prey = None  # Presas al empezar sus fases, para que las crías no se muevan
+        self.births = None  # Crías interiores a la espera de su cupo, ver admit
+
+    # ---------------------- Consultas ----------------------
+    def find(self, mask: np.ndarray) -> np.ndarray:
+        # Índices locales de las celdas interiores que cumplen `mask`
+        return np.flatnonzero(mask) + self.size
+
+    def edges(self):
+        return self.species[1].copy(), self.species[-2].copy()
+
+    def set_halo(self, above, below):
+        self.species[0] = OUTSIDE if above is None else above
+        self.species[-1] = OUTSIDE if below is None else below
+
+    def counts(self) -> np.ndarray:
+        return np.bincount(self.species[1:-1].ravel(), minlength=4)
+
+    def empty_cells(self) -> np.ndarray:
+        return np.flatnonzero(self.species[1:-1] == EMPTY) + self.row0 * self.size
+
+    def column_extremes(self):
+        # Primera y última fila global con presa en cada columna, -1 si no hay
+        is_prey = self.species[1:-1] == PREY
+        found = is_prey.any(axis=0)
+        top = np.where(found, is_prey.argmax(axis=0) + self.row0, -1)
+        bottom = np.where(found, self.row0 + self.rows - 1 - is_prey[::-1].argmax(axis=0), -1)
+        return top, bottom
+
+    def species_bytes(self) -> bytes:
+        return self.species[1:-1].tobytes()
+
+    def state_bytes(self) -> bytes:
+        return b''.join(array[1:-1].tobytes() for array in
+                        (self.species, self.health, self.energy, self.starvation_time))
+
+    def state_arrays(self) -> tuple:
+        return tuple(array[1:-1].copy() for array in (self.health, self.energy, self.starvation_time))
+
+    # ---------------------- Cambios ----------------------
+    def spawn(self, cells: np.ndarray, code: int, energy: int):
+        local = cells - self.offset
+        self.species.flat[local] = code
+        self.health.flat[local] = 100
+        self.energy.flat[local] = energy
+        self.starvation_time.flat[local] = 0
+
+    def starve(self):
+        interior = slice(1, -1)
+        self.predators = self.find((self.species[interior] == PREDATOR) & (self.health[interior] > 0))
+        self.starvation_time.flat[self.predators] += 1
+        starved = self.starvation_time.flat[self.predators] >= self.max_starvation_time
+        self.health.flat[self.predators[starved]] = 0
+
+    def reap(self) -> int:
+        interior = slice(1, -1)
+        dead = (self.species[interior] == PREDATOR) & (self.health[interior] <= 0)
+        for array in (self.species, self.health, self.energy, self.starvation_time):
+            array[interior][dead] = 0
+        return int(np.count_nonzero(dead))
+
+    def first_adjacent(self, cells: np.ndarray, allowed: tuple) -> np.ndarray:
+        # Como ArrayEcosystem.first_adjacent, para celdas interiores (la tabla empieza en la fila 1)
+        target = np.full(len(cells), -1, dtype=np.int64)
+        for neighbour in self.neighbours:
+            candidate = neighbour[cells - self.size]
+            valid = (candidate >= 0) & np.isin(self.species.flat[candidate], allowed) & (target < 0)
+            target[valid] = candidate[valid]
+        return target
+
+    def hunting_targets(self, predators: np.ndarray, above: np.ndarray, below: np.ndarray) -> np.ndarray:
+        # Campo de la franja; fuera de ella, la presa más cercana de la columna viene de las demás
+        field = prey_field(self.species[1:-1] == PREY, above, below, self.row0)
+        xs, ys = np.divmod(predators, self.size)
+        codes = field[xs - 1, ys]
+        steps = STEPS[codes]
+        visible = codes >= 0
+        target = np.where(visible, predators + steps[:, 0] * self.size + steps[:, 1], -1)
+        reachable = np.isin(self.species.flat[np.where(visible, target, 0)], (EMPTY, PREY))
+        return np.where(visible, np.where(reachable, target, -2), -1)
+
+    def payload(self, kind: str, sources: np.ndarray):
+        if kind not in MOVES:
+            return None
+        return np.stack([array.flat[sources].astype(np.int32) for array in
+                         (self.species, self.health, self.energy, self.starvation_time)], axis=1)
+
+    def land(self, kind: str, targets: np.ndarray, payload):
+        # Efecto en la celda destino
+        if kind == 'prey_birth':
+            self.spawn(targets + self.offset, PREY, energy=0)
+        elif kind == 'pred_birth':
+            self.spawn(targets + self.offset, PREDATOR, energy=10)
+        else:
+            fed = self.species.flat[targets] == (PLANT if kind == 'prey_move' else PREY)
+            for column, array in enumerate((self.species, self.health, self.energy, self.starvation_time)):
+                array.flat[targets] = payload[:, column]
+            self.energy.flat[targets[fed]] += 10
+            if kind == 'pred_move':
+                self.starvation_time.flat[targets[fed]] = 0
+
+    def leave(self, kind: str, sources: np.ndarray):
+        # Efecto en la celda origen
+        if kind == 'pred_birth':
+            self.energy.flat[sources] = 0
+        elif kind in MOVES:
+            for array in (self.species, self.health, self.energy, self.starvation_time):
+                array.flat[sources] = 0
+
+    def candidates(self, kind: str, above=None, below=None):
+        # Agentes con destino válido y su destino, en índices locales y orden de filas
+        interior = self.species[1:-1]
+        if kind in ('prey_birth', 'prey_move'):
+            if self.prey is None:
+                self.prey = self.find(interior == PREY)
+            sources = self.prey
+            if kind == 'prey_move':
+                self.prey = None  # Las crías de este ciclo se mueven a partir del siguiente
+            targets = self.first_adjacent(sources, (EMPTY, PLANT))
+        elif kind == 'pred_birth':
+            sources = self.predators[self.energy.flat[self.predators] >= 50]
+            targets = self.first_adjacent(sources, (EMPTY,))
+        else:
+            sources = self.predators
+            targets = self.hunting_targets(sources, above, below)
+            wander = targets == -1
+            targets[wander] = self.first_adjacent(sources[wander], (EMPTY,))
+        keep = targets >= 0
+        return sources[keep], targets[keep]
+
+    def split(self, sources: np.ndarray, targets: np.ndarray):
+        # Las propuestas a filas interiores se resuelven aquí (gana la primera en orden de
+        # filas); las que tocan el borde o el halo se devuelven aparte para el coordinador
+        rows = targets // self.size
+        edge = (rows <= 1) | (rows >= self.rows)
+        inner_sources, inner_targets = sources[~edge], targets[~edge]
+        _, first = np.unique(inner_targets, return_index=True)
+        first.sort()
+        return (inner_sources[first], inner_targets[first]), (sources[edge], targets[edge])
+
+    def propose(self, kind: str, above=None, below=None):
+        (winners, landing), (sources, targets) = self.split(*self.candidates(kind, above, below))
+        self.land(kind, landing, self.payload(kind, winners))
+        self.leave(kind, winners)
+        return sources + self.offset, targets + self.offset, self.payload(kind, sources)
+
+    def propose_births(self):
+        # Como propose('prey_birth'), pero las crías interiores esperan a admit()
+        (winners, landing), (sources, targets) = self.split(*self.candidates('prey_birth'))
+        self.births = winners, landing
+        return sources + self.offset, targets + self.offset, len(winners)
+
+    def first_claims(self, sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        # Posición de la propuesta ganadora de cada celda: la primera en orden de filas
+        order = np.argsort(sources, kind='stable')
+        _, first = np.unique(targets[order], return_index=True)
+        return order[np.sort(first)]
+
+    def settle(self, kind: str, sources: np.ndarray, targets: np.ndarray, payload) -> np.ndarray:
+        # Todas las propuestas a celdas de borde de esta franja
+        first = self.first_claims(sources, targets)
+        self.land(kind, targets[first] - self.offset, payload[first] if payload is not None else None)
+        return sources[first]
+
+    def claims(self, sources: np.ndarray, targets: np.ndarray):
+        # Como settle sin escribir: las crías de borde esperan a su cupo
+        first = self.first_claims(sources, targets)
+        return sources[first], targets[first]
+
+    def admit(self, quota: int, edge_sources: np.ndarray) -> np.ndarray:
+        # Nacen las `quota` primeras crías de esta franja en orden de filas, interiores o de
+        # borde; devuelve cuáles de las de borde caben (las escribe la franja dueña)
+        winners, landing = self.births
+        self.births = None
+        order = np.argsort(np.concatenate([winners + self.offset, edge_sources]), kind='stable')
+        admitted = np.zeros(len(order), dtype=bool)
+        admitted[order[:quota]] = True
+        self.land('prey_birth', landing[admitted[:len(winners)]], None)
+        return admitted[len(winners):]
+
+    def release(self, kind: str, sources: np.ndarray):
+        self.leave(kind, sources - self.offset)
+
+
+# ======================= Ejecución de franjas =======================
+def serve(conn, tile: Tile):
+    while True:
+        name, args = conn.recv()
+        if name is None:
+            conn.close()
+            return
+        conn.send(getattr(tile, name)(*args))
+
+
+class TileWorker:
+    def __init__(self, tile: Tile):
+        self.conn, child = Pipe()
+        self.process = Process(target=serve, args=(child, tile), daemon=True)
+        self.process.start()
+        child.close()
+
+    def request(self, name: str, *args):
+        self.conn.send((name, args))
+
+    def result(self):
+        return self.conn.recv()
+
+    def close(self):
+        try:
+            self.conn.send((None, ()))
+        except OSError:
+            pass  # El proceso ya terminó
+        self.process.join()
+
+
+class LocalTile:
+    # Misma interfaz que TileWorker, en este proceso
+    def __init__(self, tile: Tile):
+        self.tile = tile
+        self.pending = None
+
+    def request(self, name: str, *args):
+        self.pending = getattr(self.tile, name)(*args)
+
+    def result(self):
+        return self.pending
+
+    def close(self):
+        pass
+
+
+def close_tiles(tiles: list):
+    # También la llama weakref.finalize si el ecosistema se pierde sin close()
+    for tile in tiles:
+        tile.close()
+    tiles.clear()
+
+
+# ======================= Ecosistema por franjas =======================
+class TiledEcosystem(Ecosystem):
+    """Backend numpy repartido en franjas horizontales, una por proceso.
+
+    Parte del mismo estado inicial que ArrayEcosystem con la misma semilla y
+    produce exactamente los mismos ciclos: en cada fase las franjas
+    intercambian filas halo, las propuestas que cruzan un borde las resuelve
+    la franja dueña en orden global de filas, y la visión por columna usa la
+    primera/última presa de cada columna de las otras franjas. La
+    regeneración de plantas se sortea en el coordinador.
+
+    Los procesos se liberan con close() (o usándolo con `with`); si nadie lo
+    llama, al recoger el objeto o al salir del intérprete.
+    """
+
+    def __init__(self, size: int, max_cycles: int, iterative: bool = False, *, backend: str = 'tiled',
+                 tiles: int = 2, processes: bool = True, wrap: bool = False, **options):
+        if wrap:
+            # Los halos solo se intercambian entre franjas contiguas, no de la última a la primera
+            raise ValueError("el backend tiled no admite wrap")
+        tiles = max(1, min(tiles, size))
+        self.row_starts = np.array([size * i // tiles for i in range(tiles)] + [size])
+        self.runner = TileWorker if processes else LocalTile
+        # synchronous se acepta sin efecto, como en ArrayEcosystem
+        super().__init__(size, max_cycles, iterative, backend=backend, **options)
+
+    create_rng = ArrayEcosystem.create_rng
+    create_neighbours = ArrayEcosystem.create_neighbours
+
+    def create_world(self):
+        self.tiles = []
+        self.finalizer = weakref.finalize(self, close_tiles, self.tiles)
+
+    def initialize_organisms(self):
+        # Se sortea el mundo entero con self.rng, igual que ArrayEcosystem con la misma
+        # semilla, y se reparte en franjas
+        world = ArrayEcosystem(self.size, self.max_cycles, seed=self.rng)
+        self.num_plants, self.num_prey, self.num_predators = world.num_plants, world.num_prey, world.num_predators
+        for start, end in zip(self.row_starts[:-1], self.row_starts[1:]):
+            rows = slice(start, end)
+            tile = Tile(self.size, int(start), world.species[rows], world.health[rows], world.energy[rows],
+                        world.starvation_time[rows], world.max_starvation_time)
+            self.tiles.append(self.runner(tile))
+
+    def __enter__(self) -> 'TiledEcosystem':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def call(self, name: str, args=None) -> list:
+        # Lanza la misma operación en todas las franjas y espera todas las respuestas
+        for index, tile in enumerate(self.tiles):
+            tile.request(name, *(args[index] if args is not None else ()))
+        return [tile.result() for tile in self.tiles]
+
+    def owner(self, cells: np.ndarray) -> np.ndarray:
+        return np.searchsorted(self.row_starts, cells // self.size, side='right') - 1
+
+    def count_organisms(self):
+        counts = sum(self.call('counts'))
+        self.num_plants = int(counts[PLANT])
+        self.num_prey = int(counts[PREY])
+        self.num_predators = int(counts[PREDATOR])
+
+    def exchange_halos(self):
+        edges = self.call('edges')
+        last = len(self.tiles) - 1
+        self.call('set_halo', [(edges[i - 1][1] if i > 0 else None, edges[i + 1][0] if i < last else None)
+                               for i in range(len(self.tiles))])
+
+    def phase(self, kind: str, args=None):
+        self.exchange_halos()
+        proposals = self.call('propose', [(kind,) + tuple(extra) for extra in args] if args else
+                              [(kind,)] * len(self.tiles))
+        sources = np.concatenate([p[0] for p in proposals])
+        targets = np.concatenate([p[1] for p in proposals])
+        payloads = [p[2] for p in proposals if p[2] is not None]
+        payload = np.concatenate(payloads) if payloads else None
+
+        owners = self.owner(targets)
+        winners = np.concatenate(self.call('settle', [
+            (kind, sources[owners == i], targets[owners == i],
+             payload[owners == i] if payload is not None else None)
+            for i in range(len(self.tiles))]))
+        owners = self.owner(winners)
+        self.call('release', [(kind, winners[owners == i]) for i in range(len(self.tiles))])
+
+    def prey_births(self, limit: int):
+        """Solo nacen las `limit` primeras crías en orden de filas (ArrayEcosystem.update_prey).
+
+        Si caben todas basta la fase normal. Si no, cada franja resuelve sus
+        crías interiores sin escribirlas y las de borde se reparten como en
+        phase(); con cuántas gana cada franja, una suma acumulada da el cupo
+        de cada una, y cada franja admite sus primeras crías hasta su cupo.
+        Solo viajan las propuestas de borde y un contador por franja.
+        """
+        if self.num_prey <= limit:
+            self.phase('prey_birth')
+            return
+        count = len(self.tiles)
+        self.exchange_halos()
+        proposals = self.call('propose_births')
+        sources = np.concatenate([p[0] for p in proposals])
+        targets = np.concatenate([p[1] for p in proposals])
+        owners = self.owner(targets)
+        claims = self.call('claims', [(sources[owners == i], targets[owners == i]) for i in range(count)])
+        sources = np.concatenate([c[0] for c in claims])
+        targets = np.concatenate([c[1] for c in claims])
+
+        parents = self.owner(sources)
+        totals = np.array([p[2] for p in proposals]) + np.bincount(parents, minlength=count)
+        quotas = np.clip(limit - (np.cumsum(totals) - totals), 0, totals)
+        admitted = self.call('admit', [(int(quotas[i]), sources[parents == i]) for i in range(count)])
+        births = np.concatenate([targets[parents == i][admitted[i]] for i in range(count)])
+        owners = self.owner(births)
+        self.call('spawn', [(births[owners == i], PREY, 0) for i in range(count)])
+
+    def column_vision(self):
+        # Presa más cercana hacia arriba/abajo en otras franjas, por columna
+        extremes = self.call('column_extremes')
+        above = [np.full(self.size, -1)]
+        for _, bottom in extremes[:-1]:
+            above.append(np.where(bottom >= 0, bottom, above[-1]))
+        below = [np.full(self.size, -1)]
+        for top, _ in reversed(extremes[1:]):
+            below.append(np.where(top >= 0, top, below[-1]))
+        return list(zip(above, reversed(below)))
+
+    def update_ecosystem(self):
+        previous = self.species if self.recorder is not None else None
+        if self.cycle_count % self.plant_regeneration_interval == 0 and self.cycle_count != 0:
+            empty = np.concatenate(self.call('empty_cells'))
+            cells = self.rng.choice(empty, size=min((self.size ** 2) // 6, len(empty)), replace=False)
+            owners = self.owner(cells)
+            self.call('spawn', [(cells[owners == i], PLANT, 0) for i in range(len(self.tiles))])
+            self.count_organisms()
+
+        if self.num_plants >= self.num_prey + 2:
+            self.prey_births(self.num_plants - self.num_prey - 1)
+        self.phase('prey_move')
+        self.call('starve')
+        self.phase('pred_birth')
+        self.phase('pred_move', self.column_vision())
+        self.reaped += sum(self.call('reap'))
+        self.count_organisms()
+        self.cycle_count += 1
+        if previous is not None:
+            # Como ArrayEcosystem: el delta sale de comparar con la cuadrícula reunida antes del ciclo
+            species = self.species.ravel()
+            changed = np.flatnonzero(previous.ravel() != species)
+            self.recorder.cells(changed.tolist(), species[changed].tobytes())
+            self.recorder.end_cycle(self)
+        if self.detector is not None:
+            self.detector.end_cycle(self)
+
+    def state_arrays(self) -> list:
+        # health, energy y starvation_time del mundo entero, para save_checkpoint
+        parts = self.call('state_arrays')
+        return [np.concatenate([part[i] for part in parts]) for i in range(3)]
+
+    def species_bytes(self) -> bytes:
+        return b''.join(self.call('species_bytes'))
+
+    def layout_hash(self) -> int:
+        return hash(self.species_bytes())
+
+    def state_fingerprint(self) -> tuple:
+        return (tuple(self.call('state_bytes')), self.cycle_count % self.plant_regeneration_interval,
+                repr(self.rng.bit_generator.state))
+
+    def memory_gauges(self) -> dict:
+        return {'tiles': len(self.tiles)}
+
+    @property
+    def species(self) -> np.ndarray:
+        # Copia reunida de todas las franjas, solo lectura
+        return np.frombuffer(self.species_bytes(), np.int8).reshape(self.size, self.size)
+
+    def print_grid(self, row=0):
+        ArrayEcosystem.print_grid(self, row)
+
+    def close(self):
+        self.finalizer()
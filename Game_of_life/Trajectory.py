@@ -0,0 +1,121 @@
+import mmap
+import struct
+import zlib
+from typing import Iterator, List, Tuple
+
+from .Species import EMPTY
+
+# Registro de trayectoria, solo se escribe al final:
+#   cabecera | bloque* ; bloque = tipo, ciclo, longitud, datos zlib
+# KEYFRAME: cuadrícula completa de códigos de especie (size² bytes)
+# DELTA:    celdas cambiadas en el ciclo, índices ordenados codificados como
+#           diferencias sucesivas (uint32) seguidos del código nuevo de cada una
+MAGIC = b'GOLT'
+VERSION = 1
+HEADER = struct.Struct('<4sHxxI')
+BLOCK = struct.Struct('<BII')
+KEYFRAME = 0
+DELTA = 1
+
+
+# ======================= Grabación =======================
+class TrajectoryRecorder:
+    """Escribe los cambios de celda de cada ciclo en un registro comprimido.
+
+    Lo alimentan add_organism, delete_organism y move_organism, así que el
+    coste por ciclo es proporcional a la actividad y no al área.
+    """
+
+    def __init__(self, path: str, ecosystem: 'Ecosystem', keyframe_every: int = 0):
+        self.size = ecosystem.size
+        self.keyframe_every = keyframe_every
+        self.changes = {}
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION, self.size))
+        self.write(KEYFRAME, ecosystem.cycle_count, ecosystem.species_bytes())
+
+    def cell(self, x: int, y: int, code: int):
+        self.changes[x * self.size + y] = code
+
+    def move(self, old_x: int, old_y: int, new_x: int, new_y: int, code: int):
+        self.changes[old_x * self.size + old_y] = EMPTY
+        self.changes[new_x * self.size + new_y] = code
+
+    def cells(self, cells: List[int], codes: bytes):
+        self.changes.update(zip(cells, codes))
+
+    def end_cycle(self, ecosystem: 'Ecosystem'):
+        if self.keyframe_every and ecosystem.cycle_count % self.keyframe_every == 0:
+            self.write(KEYFRAME, ecosystem.cycle_count, ecosystem.species_bytes())
+        else:
+            cells = sorted(self.changes)
+            deltas = [cell - previous for previous, cell in zip([0] + cells, cells)]
+            payload = struct.pack(f'<I{len(cells)}I', len(cells), *deltas)
+            self.write(DELTA, ecosystem.cycle_count, payload + bytes(self.changes[cell] for cell in cells))
+        self.changes = {}
+
+    def write(self, kind: int, cycle: int, payload: bytes):
+        data = zlib.compress(payload)
+        self.file.write(BLOCK.pack(kind, cycle, len(data)))
+        self.file.write(data)
+
+    def close(self):
+        self.file.close()
+
+
+# ======================= Reproducción =======================
+class TrajectoryReplayer:
+    """Reconstruye cualquier ciclo desde el último keyframe anterior."""
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.size = HEADER.unpack_from(self.data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} no es una trayectoria v{VERSION}")
+        self.blocks = []  # (tipo, ciclo, offset de los datos, longitud)
+        offset = HEADER.size
+        while offset < len(self.data):
+            kind, cycle, length = BLOCK.unpack_from(self.data, offset)
+            offset += BLOCK.size
+            self.blocks.append((kind, cycle, offset, length))
+            offset += length
+
+    @property
+    def cycles(self) -> List[int]:
+        return [cycle for _, cycle, _, _ in self.blocks]
+
+    def payload(self, offset: int, length: int) -> bytes:
+        return zlib.decompress(self.data[offset:offset + length])
+
+    def apply(self, frame: bytearray, kind: int, payload: bytes):
+        if kind == KEYFRAME:
+            frame[:] = payload
+            return
+        (count,) = struct.unpack_from('<I', payload)
+        deltas = struct.unpack_from(f'<{count}I', payload, 4)
+        codes = payload[4 + 4 * count:]
+        cell = 0
+        for delta, code in zip(deltas, codes):
+            cell += delta
+            frame[cell] = code
+
+    def frame(self, cycle: int) -> bytearray:
+        positions = [i for i, block in enumerate(self.blocks) if block[1] == cycle]
+        if not positions:
+            raise ValueError(f"El ciclo {cycle} no está en la trayectoria")
+        end = positions[-1]
+        start = max(i for i in range(end + 1) if self.blocks[i][0] == KEYFRAME)
+        frame = bytearray(self.size * self.size)
+        for kind, _, offset, length in self.blocks[start:end + 1]:
+            self.apply(frame, kind, self.payload(offset, length))
+        return frame
+
+    def frames(self) -> Iterator[Tuple[int, bytes]]:
+        frame = bytearray(self.size * self.size)
+        for kind, cycle, offset, length in self.blocks:
+            self.apply(frame, kind, self.payload(offset, length))
+            yield cycle, bytes(frame)
+
+    def close(self):
+        self.data.close()
@@ -0,0 +1,5 @@
+from .Organism import Organism
+from .Plant import Plant
+from .Prey import Prey
+from .Predator import Predator
+from .Ecosystem import Ecosystem
@@ -0,0 +1,89 @@
+import argparse
+import sys
+
+from .Batch import run_batch
+from .Benchmark import VARIANTS, run_benchmarks, write_report
+from .LiveView import live_view
+from .ResultCache import ResultCache
+
+
+def positive_float(text: str) -> float:
+    value = float(text)
+    if not value > 0:  # También descarta nan
+        raise argparse.ArgumentTypeError(f"debe ser mayor que 0: {text}")
+    return value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m Game_of_life")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="simulación por lotes, sin dibujar la cuadrícula")
+    run.add_argument("--size", type=int, default=10)
+    run.add_argument("--cycles", type=int, default=30)
+    run.add_argument("--seed", type=int, default=None)
+    run.add_argument("--report-every", type=int, default=0, help="0 = solo el resumen final")
+    run.add_argument("--backend", choices=("objects", "numpy", "tiled", "sparse"), default="objects")
+    run.add_argument("--tiles", type=int, default=2, help="franjas/procesos con --backend tiled")
+    run.add_argument("--density", type=float, default=1.0,
+                     help="escala de la población inicial y la regeneración con --backend sparse")
+    run.add_argument("--detect", choices=("stop", "jump"), default=None,
+                     help="parar (o saltar a --cycles) si el estado entra en un ciclo")
+    run.add_argument("--profile", metavar="PATH", default=None,
+                     help="pilas colapsadas (flamegraph) por fase y método en PATH")
+    run.add_argument("--profile-table", action="store_true", help="tabla de tiempos y contadores por ciclo")
+    run.add_argument("--wrap", action="store_true", help="mundo toroidal (no disponible con --backend tiled)")
+    run.add_argument("--synchronous", action="store_true",
+                     help="todos deciden sobre el mismo estado y se resuelven los conflictos (objects, sparse)")
+    run.add_argument("--cache", metavar="DIR", default=None,
+                     help="reutilizar resultados guardados en DIR (requiere --seed)")
+
+    live = commands.add_parser("live", help="vista en vivo con la simulación en otro proceso")
+    live.add_argument("--size", type=int, default=10)
+    live.add_argument("--cycles", type=int, default=30)
+    live.add_argument("--seed", type=int, default=None)
+    live.add_argument("--fps", type=positive_float, default=30)
+    live.add_argument("--backend", choices=("objects", "numpy", "sparse"), default="objects")
+
+    bench = commands.add_parser("bench", help="compara main.py, test.py y el paquete; resultados en JSON")
+    bench.add_argument("--variants", nargs="+", choices=VARIANTS, default=list(VARIANTS))
+    bench.add_argument("--sizes", nargs="+", type=int, default=[10, 30])
+    bench.add_argument("--densities", nargs="+", type=float, default=[1.0, 0.5],
+                       help="fracción de la población inicial por defecto")
+    bench.add_argument("--cycles", nargs="+", type=int, default=[30, 100])
+    bench.add_argument("--seeds", nargs="+", type=int, default=[0, 1, 2])
+    bench.add_argument("--out", default="bench.json")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        if args.wrap and args.backend == "tiled":
+            parser.error("--wrap no está disponible con --backend tiled")
+        result = run_batch(args.size, args.cycles, args.seed, args.report_every, args.backend,
+                           tiles=args.tiles, profile=bool(args.profile or args.profile_table),
+                           density=args.density, detect=args.detect,
+                           cache=ResultCache(args.cache) if args.cache else None, wrap=args.wrap,
+                           synchronous=args.synchronous)
+        print(f"Ciclos: {result['cycles']} | Plantas: {result['num_plants']} | "
+              f"Presas: {result['num_prey']} | Depredadores: {result['num_predators']}")
+        if result['cached']:
+            print("Resultado leído de la caché")
+        else:
+            print(f"Ciclos/s: {result['cycles_per_sec']:.2f}")
+            print(" | ".join(f"{name}: {value}" for name, value in result['gauges'].items()
+                             if not name.startswith('num_') and name != 'cycle'))
+        if result['detector'] is not None:
+            print(f"Ciclos de estados: {result['detector'].describe()}")
+        if args.profile:
+            result['profiler'].write_collapsed(args.profile)
+        if args.profile_table:
+            result['profiler'].write_table(sys.stdout)
+    elif args.command == "live":
+        live_view(args.size, args.cycles, args.seed, args.backend, args.fps)
+    elif args.command == "bench":
+        report = run_benchmarks(args.variants, args.sizes, args.densities, args.cycles, args.seeds)
+        write_report(report, args.out)
+        print(f"Resultados: {args.out}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
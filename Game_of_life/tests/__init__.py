@@ -0,0 +1,12 @@
+from Game_of_life.Ecosystem import Ecosystem
+
+SEEDS = (1, 7, 42)
+
+
+def states(eco: Ecosystem) -> list:
+    # Cuadrícula y contadores de cada ciclo hasta que la simulación termina
+    result = [(eco.species_bytes(), eco.num_plants, eco.num_prey, eco.num_predators)]
+    while not eco.is_simulation_over():
+        eco.update_ecosystem()
+        result.append((eco.species_bytes(), eco.num_plants, eco.num_prey, eco.num_predators))
+    return result
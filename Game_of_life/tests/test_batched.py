@@ -0,0 +1,18 @@
+import pytest
+
+from Game_of_life.Ecosystem import Ecosystem
+
+from . import SEEDS, states
+
+pytest.importorskip('numpy')
+
+
+# ======================= Mundos en lote =======================
+@pytest.mark.parametrize('size', (9, 20))
+def test_batched_matches_numpy(size):
+    from Game_of_life.BatchedWorlds import batched_series
+
+    batched = batched_series(size, 50, list(SEEDS))
+    for seed, series in zip(SEEDS, batched):
+        numpy = states(Ecosystem(size, 50, backend='numpy', seed=seed))
+        assert series == [state[1:] for state in numpy]
@@ -0,0 +1,27 @@
+import pytest
+
+from Game_of_life.Ecosystem import Ecosystem
+
+from . import SEEDS, states
+
+
+# ======================= Checkpoints =======================
+@pytest.mark.parametrize('backend', ('objects', 'numpy'))
+@pytest.mark.parametrize('seed', SEEDS)
+def test_checkpoint_resume(tmp_path, backend, seed):
+    if backend == 'numpy':
+        pytest.importorskip('numpy')
+    eco = Ecosystem(12, 40, iterative=True, backend=backend, seed=seed)
+    for _ in range(5):
+        eco.update_ecosystem()
+    path = str(tmp_path / 'eco.ckpt')
+    eco.save_checkpoint(path)
+    resumed = Ecosystem.load_checkpoint(path)
+    assert resumed.cycle_count == eco.cycle_count
+    assert states(resumed) == states(eco)
+
+
+def test_checkpoint_rejects_sparse(tmp_path):
+    eco = Ecosystem(12, 40, iterative=True, backend='sparse', seed=1)
+    with pytest.raises(ValueError):
+        eco.save_checkpoint(str(tmp_path / 'eco.ckpt'))
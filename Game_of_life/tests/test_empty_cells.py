@@ -0,0 +1,26 @@
+import pytest
+
+from Game_of_life.Ecosystem import Ecosystem
+
+from . import SEEDS
+
+
+def scanned_empty(eco: Ecosystem) -> set:
+    # Recorrido completo de referencia, sin barajar para no tocar el rng
+    return {(x, y) for x in range(eco.size) for y in range(eco.size)
+            if eco.grid[x][y] is None and (x, y) not in eco.plants}
+
+
+# ======================= Índice de celdas vacías =======================
+@pytest.mark.parametrize('wrap', (False, True))
+@pytest.mark.parametrize('seed', SEEDS)
+def test_index_matches_scan(wrap, seed):
+    eco = Ecosystem(12, 40, iterative=True, seed=seed, wrap=wrap)
+    while True:
+        empty = eco.empty_cells
+        assert {divmod(cell, eco.size) for cell in empty.cells} == scanned_empty(eco)
+        assert len(empty.cells) == len(empty.positions)
+        assert all(empty.cells[index] == cell for cell, index in empty.positions.items())
+        if eco.is_simulation_over():
+            break
+        eco.update_ecosystem()
@@ -0,0 +1,59 @@
+import pytest
+
+from Game_of_life.Predator import Predator
+from Game_of_life.PreyIndex import PreyIndex
+
+np = pytest.importorskip('numpy')
+
+
+def random_prey(seed: int, size: int = 16, density: float = 0.08):
+    return np.random.default_rng(seed).random((size, size)) < density
+
+
+def expected_codes(is_prey) -> dict:
+    # Código de STEPS que sale de PreyIndex.nearest + get_direction en cada celda sin presa
+    size = len(is_prey)
+    index = PreyIndex(size)
+    for x, y in zip(*np.nonzero(is_prey)):
+        index.add(int(x), int(y))
+    codes = {}
+    for x in range(size):
+        for y in range(size):
+            if is_prey[x, y]:
+                continue
+            target = index.nearest(x, y)
+            if target is None:
+                codes[x, y] = -1
+            else:
+                step = Predator(x, y, 100, 0).get_direction(target)
+                codes[x, y] = [(0, -1), (0, 1), (-1, 0), (1, 0)].index(step)
+    return codes
+
+
+# ======================= Campo de presas =======================
+@pytest.mark.parametrize('seed', range(5))
+def test_field_matches_index(seed):
+    from Game_of_life.PreyField import prey_field
+
+    is_prey = random_prey(seed)
+    field = prey_field(is_prey)
+    expected = expected_codes(is_prey)
+    assert {cell: int(field[cell]) for cell in expected} == expected
+
+
+@pytest.mark.parametrize('strips', (2, 3, 5))
+def test_strips_match_whole_field(strips):
+    from Game_of_life.PreyField import prey_field
+
+    is_prey = random_prey(strips, density=0.03)
+    size = len(is_prey)
+    rows = np.arange(size)[:, None]
+    whole = prey_field(is_prey)
+    bounds = np.linspace(0, size, strips + 1).astype(int)
+    for row0, end in zip(bounds[:-1], bounds[1:]):
+        # Fila global de la presa más cercana por encima y por debajo de la franja, por columna
+        above = np.where(is_prey & (rows < row0), rows, -1).max(axis=0)
+        below = np.where(is_prey & (rows >= end), rows, size).min(axis=0)
+        below[below == size] = -1
+        strip = prey_field(is_prey[row0:end], above, below, row0)
+        assert (strip == whole[row0:end]).all()
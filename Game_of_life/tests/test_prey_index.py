@@ -0,0 +1,23 @@
+import pytest
+
+from Game_of_life.Ecosystem import Ecosystem
+from Game_of_life.Predator import Predator
+
+from . import SEEDS
+
+
+# ======================= Índice de presas =======================
+@pytest.mark.parametrize('iterative', (False, True))
+@pytest.mark.parametrize('seed', SEEDS)
+def test_nearest_matches_scan(iterative, seed):
+    eco = Ecosystem(15, 40, iterative=True, seed=seed)
+    while not eco.is_simulation_over():
+        eco.iterative = iterative  # Solo para elegir la variante de referencia
+        for predator in eco.organisms.queues[Predator]:
+            if iterative:
+                expected = predator.get_closest_prey_iterative(predator.find_visible_prey_iterative(eco))
+            else:
+                expected = predator.get_closest_prey(predator.find_visible_prey(eco))
+            assert eco.prey_index.nearest(predator.x, predator.y) == expected
+        eco.iterative = True
+        eco.update_ecosystem()
@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from Game_of_life.Ecosystem import Ecosystem
+from Game_of_life.OrganismRegistry import OrganismRegistry
+from Game_of_life.Prey import Prey
+
+from . import SEEDS
+
+
+# ======================= Registro de organismos =======================
+def test_registry_matches_list():
+    rng = random.Random(0)
+    registry, reference = OrganismRegistry(), []
+    for step in range(2000):
+        if reference and rng.random() < 0.45:
+            organism = reference.pop(rng.randrange(len(reference)))
+            registry.remove(organism)
+            assert organism not in registry
+        else:
+            organism = Prey(step, step, 100, 0)
+            registry.append(organism)
+            reference.append(organism)
+        if step % 97 == 0:
+            registry.compact()
+            assert registry.tombstones == 0
+        assert len(registry) == len(reference)
+    # Borrar no desplaza: el orden de recorrido es el de alta
+    assert [id(org) for org in registry] == [id(org) for org in reference]
+    assert all(registry.slots[position] is not None for position in registry.index.values())
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_registry_matches_grid(seed):
+    eco = Ecosystem(12, 40, iterative=True, seed=seed)
+    while True:
+        on_grid = {id(org) for row in eco.grid for org in row if org is not None}
+        assert {id(org) for org in eco.organisms} == on_grid
+        assert len(eco.organisms) == eco.num_prey + eco.num_predators == len(on_grid)
+        if eco.is_simulation_over():
+            break
+        eco.update_ecosystem()
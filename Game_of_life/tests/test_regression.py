@@ -0,0 +1,19 @@
+import sys
+
+import pytest
+
+from Game_of_life.Ecosystem import Ecosystem
+
+from . import SEEDS, states
+
+
+# ======================= Recursivo e iterativo =======================
+@pytest.mark.parametrize('seed', SEEDS)
+def test_recursive_matches_iterative(seed):
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(10 ** 5)
+    try:
+        recursive = states(Ecosystem(10, 40, iterative=False, seed=seed))
+    finally:
+        sys.setrecursionlimit(limit)
+    assert recursive == states(Ecosystem(10, 40, iterative=True, seed=seed))
@@ -0,0 +1,42 @@
+import io
+import os
+
+import pytest
+
+from Game_of_life import Ensemble
+from Game_of_life.Batch import run_batch
+from Game_of_life.Ensemble import run_ensemble
+from Game_of_life.ResultCache import ResultCache
+
+
+# ======================= Caché de resultados =======================
+def test_evicts_least_recently_used(tmp_path):
+    cache = ResultCache(str(tmp_path), max_bytes=10 ** 6)
+    result = {'series': [[0, 0, 0]] * 20}
+    for age, key in enumerate(('a', 'b', 'c')):
+        cache.put(key, result)
+        os.utime(tmp_path / f"{key}.json", (1000 + age, 1000 + age))
+    assert cache.get('a') == result  # Leer 'a' la vuelve la más reciente
+    cache.max_bytes = 3 * (tmp_path / 'a.json').stat().st_size
+    cache.put('d', result)
+    assert sorted(file.stem for file in tmp_path.glob('*.json')) == ['a', 'c', 'd']
+    assert cache.get('b') is None
+    assert cache.total == sum(file.stat().st_size for file in tmp_path.glob('*.json'))
+
+
+@pytest.mark.parametrize('backend', ('objects', 'numpy'))
+def test_batch_and_ensemble_share_keys(tmp_path, monkeypatch, backend):
+    if backend == 'numpy':
+        pytest.importorskip('numpy')
+    cache = ResultCache(str(tmp_path))
+    [(_, series)] = run_ensemble(10, 30, [4], workers=1, backend=backend, cache=cache)
+    result = run_batch(10, 30, 4, backend=backend, out=io.StringIO(), cache=cache)
+    assert result['cached']
+    assert (result['num_plants'], result['num_prey'], result['num_predators']) == series[-1]
+
+    # Y al revés: lo que guarda run_batch lo lee el ensemble sin simular
+    run_batch(10, 30, 5, backend=backend, out=io.StringIO(), cache=cache)
+    monkeypatch.setattr(Ensemble, 'simulate', lambda *args: iter(()))
+    aliases = ('numpy', 'batched') if backend == 'numpy' else ('objects',)
+    for alias in aliases:
+        assert [seed for seed, _ in run_ensemble(10, 30, [4, 5], workers=1, backend=alias, cache=cache)] == [4, 5]
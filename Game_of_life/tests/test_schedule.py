@@ -0,0 +1,46 @@
+import pytest
+
+from Game_of_life.Ecosystem import Ecosystem
+from Game_of_life.Predator import Predator
+from Game_of_life.Prey import Prey
+from Game_of_life.Species import PLANT, PREDATOR, PREY
+
+PLANTS = ((2, 2), (2, 3), (2, 4), (3, 0), (3, 1), (3, 2))
+
+
+def objects_world() -> Ecosystem:
+    eco = Ecosystem(5, 10, iterative=True, seed=0)
+    for organism in list(eco.organisms):
+        eco.delete_organism(organism)
+    for x, y in list(eco.plants):
+        eco.remove_plant(x, y)
+    for x, y in PLANTS:
+        eco.add_plant(x, y)
+    eco.add_organism(Prey(0, 0, 100, 0))
+    eco.add_organism(Predator(4, 4, 100, 0, 0, 5))
+    return eco
+
+
+def numpy_world() -> Ecosystem:
+    eco = Ecosystem(5, 10, backend='numpy', seed=0)
+    for array in (eco.species, eco.health, eco.energy, eco.starvation_time):
+        array[:] = 0
+    for x, y in PLANTS:
+        eco.species[x, y] = PLANT
+    eco.species[0, 0], eco.species[4, 4] = PREY, PREDATOR
+    eco.health[0, 0] = eco.health[4, 4] = 100
+    eco.count_organisms()
+    return eco
+
+
+# ======================= Crías diferidas =======================
+@pytest.mark.parametrize('build', (objects_world, numpy_world))
+def test_newborns_act_next_cycle(build):
+    if build is numpy_world:
+        pytest.importorskip('numpy')
+    eco = build()
+    eco.update_ecosystem()
+    grid = eco.species_bytes()
+    # La presa cría en (0, 1) y se mueve a (1, 0); la cría no se mueve hasta el ciclo siguiente
+    assert [cell for cell in range(25) if grid[cell] == PREY] == [1, 5]
+
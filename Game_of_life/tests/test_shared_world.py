@@ -0,0 +1,32 @@
+import pytest
+
+from Game_of_life.Ecosystem import Ecosystem
+
+np = pytest.importorskip('numpy')
+
+
+# ======================= Memoria compartida =======================
+def test_reader_sees_published_cycles():
+    from Game_of_life.SharedWorld import SharedWorldReader
+
+    eco = Ecosystem(8, 20, backend='numpy', seed=5)
+    shared = eco.share()
+    reader = SharedWorldReader(shared.name)
+    try:
+        for _ in range(3):
+            eco.update_ecosystem()
+            frame = reader.latest()
+            assert frame.cycle_count == eco.cycle_count
+            assert (frame.species == eco.species).all()
+    finally:
+        reader.close()
+        eco.stop_sharing()
+
+
+def test_stop_sharing_detaches():
+    eco = Ecosystem(8, 20, backend='numpy', seed=5)
+    eco.share()
+    eco.stop_sharing()
+    assert eco.shared is None
+    eco.update_ecosystem()  # Sin segmento ya no se publica nada
+    eco.stop_sharing()
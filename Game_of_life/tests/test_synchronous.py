@@ -0,0 +1,39 @@
+import random
+
+import pytest
+
+from Game_of_life.Ecosystem import Ecosystem
+
+from . import SEEDS, states
+
+
+def collect_shuffled(self, queue, index, end, acc):
+    # Calcula las intenciones en orden aleatorio y las deja en orden de turno
+    alive = [org for org in queue.slots[index:end] if org is not None and org.is_alive()]
+    order = list(range(len(alive)))
+    random.Random(self.cycle_count * 31 + len(acc)).shuffle(order)
+    intents = {}
+    for position in reversed(order):
+        intents[position] = alive[position].intent(self)
+    acc.extend(intents[position] for position in range(len(alive)))
+    return acc
+
+
+# ======================= Modo síncrono =======================
+@pytest.mark.parametrize('backend', ('objects', 'sparse'))
+@pytest.mark.parametrize('seed', SEEDS)
+def test_intents_independent_of_order(monkeypatch, backend, seed):
+    expected = states(Ecosystem(12, 60, iterative=True, backend=backend, seed=seed, synchronous=True))
+    monkeypatch.setattr(Ecosystem, 'collect_intents_iterative', collect_shuffled)
+    assert states(Ecosystem(12, 60, iterative=True, backend=backend, seed=seed, synchronous=True)) == expected
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_collecting_intents_reads_only(seed):
+    eco = Ecosystem(12, 60, iterative=True, seed=seed, synchronous=True)
+    while not eco.is_simulation_over():
+        before = (eco.species_bytes(), eco.zobrist, eco.state_fingerprint())
+        for queue in eco.organisms.queues.values():
+            eco.collect_intents(queue, 0, len(queue.slots), [])
+        assert (eco.species_bytes(), eco.zobrist, eco.state_fingerprint()) == before
+        eco.update_ecosystem()
@@ -0,0 +1,17 @@
+import pytest
+
+from Game_of_life.Ecosystem import Ecosystem
+
+from . import SEEDS, states
+
+pytest.importorskip('numpy')
+
+
+# ======================= Franjas =======================
+@pytest.mark.parametrize('tiles', (2, 3, 5))
+@pytest.mark.parametrize('size', (9, 20))
+def test_tiled_matches_numpy(size, tiles):
+    for seed in SEEDS:
+        numpy = states(Ecosystem(size, 50, backend='numpy', seed=seed))
+        with Ecosystem(size, 50, backend='tiled', seed=seed, tiles=tiles) as tiled:
+            assert states(tiled) == numpy
@@ -0,0 +1,27 @@
+import pytest
+
+from Game_of_life.Ecosystem import Ecosystem
+
+from . import states
+
+
+# ======================= Trayectorias =======================
+@pytest.mark.parametrize('backend', ('objects', 'numpy'))
+def test_trajectory_replay(tmp_path, backend):
+    if backend == 'numpy':
+        pytest.importorskip('numpy')
+    from Game_of_life.Trajectory import TrajectoryReplayer
+
+    path = str(tmp_path / 'eco.traj')
+    eco = Ecosystem(12, 40, iterative=True, backend=backend, seed=3)
+    eco.start_recording(path, keyframe_every=7)
+    grids = [grid for grid, *_ in states(eco)]
+    eco.stop_recording()
+
+    replayer = TrajectoryReplayer(path)
+    try:
+        replayed = dict(replayer.frames())  # El último bloque de cada ciclo deja su cuadrícula
+        assert [replayed[cycle] for cycle in range(len(grids))] == grids
+        assert bytes(replayer.frame(len(grids) // 2)) == grids[len(grids) // 2]
+    finally:
+        replayer.close()
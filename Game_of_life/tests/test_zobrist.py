@@ -0,0 +1,19 @@
+import pytest
+
+from Game_of_life.CycleDetector import zobrist_of
+from Game_of_life.Ecosystem import Ecosystem
+
+from . import SEEDS
+
+
+# ======================= Hash de Zobrist =======================
+@pytest.mark.parametrize('synchronous', (False, True))
+@pytest.mark.parametrize('backend', ('objects', 'sparse'))
+@pytest.mark.parametrize('seed', SEEDS)
+def test_incremental_matches_full(backend, synchronous, seed):
+    eco = Ecosystem(12, 60, iterative=True, backend=backend, seed=seed, synchronous=synchronous)
+    while True:
+        assert eco.zobrist == zobrist_of(eco.species_bytes())
+        if eco.is_simulation_over():
+            break
+        eco.update_ecosystem()
@@ -4,6 +4,10 @@ from abc import ABC, abstractmethod
 import random
 import sys
 
+# Variante de referencia congelada: Benchmark la mide tal cual (variante 'main') frente
+# al paquete Game_of_life. No usa neighbour_table ni los demás índices a propósito;
+# las optimizaciones van en el paquete, no aquí.
+
 # ======================= Clases Base =======================
 @dataclass
 class Organism(ABC):
@@ -139,7 +143,7 @@ class Predator(Organism):
 
     def reproduces(self, ecosystem: 'Ecosystem'):
         reproduce = [True, False]
-        random.shuffle(reproduce)
+        ecosystem.rng.shuffle(reproduce)
         
         if reproduce[0]:
             positions = self.get_empty_adjacent(ecosystem)
@@ -148,6 +152,8 @@ class Predator(Organism):
                 ecosystem.add_organism(Predator(new_x, new_y, 100, 10, 0, self.max_starvation_time))
 
     def find_visible_prey(self, ecosystem: 'Ecosystem') -> List[Tuple[int, int]]:
+        if ecosystem.iterative:
+            return self.find_visible_prey_iterative(ecosystem)
         prey = []
         
         def check_row(y: int):
@@ -170,6 +176,10 @@ class Predator(Organism):
         # check_col(0)
         return prey
 
+    def find_visible_prey_iterative(self, ecosystem: 'Ecosystem') -> List[Tuple[int, int]]:
+        row = ecosystem.grid[self.x]
+        return [(self.x, y) for y in range(ecosystem.size) if isinstance(row[y], Prey)]
+
     def get_closest_prey(self, prey_list: List[Tuple[int, int]]):
         def helper(lst, idx, closest, min_dist):
             if idx >= len(lst):
@@ -181,6 +191,10 @@ class Predator(Organism):
             return helper(lst, idx+1, closest, min_dist)
         return helper(prey_list, 0, None, float('inf'))
 
+    def get_closest_prey_iterative(self, prey_list: List[Tuple[int, int]]):
+        # min() conserva el primer empate, igual que helper
+        return min(prey_list, key=lambda pos: abs(pos[0] - self.x) + abs(pos[1] - self.y), default=None)
+
     def get_direction(self, target: Tuple[int, int]) -> Tuple[int, int]:
         # if target[0] != self.x:  # Mover en eje X
         #     return (1 if target[0] > self.x else -1, 0)
@@ -190,7 +204,10 @@ class Predator(Organism):
     def move(self, ecosystem: 'Ecosystem'):
         visible_prey = self.find_visible_prey(ecosystem)
         if visible_prey:
-            closest_pos = self.get_closest_prey(visible_prey)
+            if ecosystem.iterative:
+                closest_pos = self.get_closest_prey_iterative(visible_prey)
+            else:
+                closest_pos = self.get_closest_prey(visible_prey)
             if closest_pos:
                 direction = self.get_direction(closest_pos)
                 new_x = self.x + direction[0]
@@ -236,9 +253,13 @@ class Predator(Organism):
 
 # ======================= Ecosistema =======================
 class Ecosystem:
-    def __init__(self, size: int, max_cycles: int):
+    def __init__(self, size: int, max_cycles: int, iterative: bool = False, seed=None):
         self.size = size
         self.max_cycles = max_cycles
+        # Generador propio: la misma semilla reproduce la misma simulación
+        self.rng = random.Random(seed)
+        # Modo iterativo: misma lógica con bucles, profundidad de pila constante
+        self.iterative = iterative
         self.grid = self.create_matrix(size, size)
         self.organisms = []
         self.num_plants = 0
@@ -249,6 +270,8 @@ class Ecosystem:
         self.initialize_organisms()
 
     def create_matrix(self, rows: int, cols: int, matrix=None):
+        if self.iterative:
+            return [[None] * cols for _ in range(rows)]
         if matrix is None:
             matrix = []
         if len(matrix) == rows:
@@ -271,20 +294,31 @@ class Ecosystem:
         self.add_organisms(predators, Predator, self.get_empty_cells([]))
 
     def add_organisms(self, count: int, org_type: type, cells: list, index: int = 0):
+        if self.iterative:
+            self.add_organisms_iterative(count, org_type, cells, index)
+            return
         if count <= 0 or index >= len(cells):
             return
-        x, y = cells[index]
+        self.add_organism(self.new_organism(org_type, *cells[index]))
+        self.add_organisms(count - 1, org_type, cells, index + 1)
+
+    def add_organisms_iterative(self, count: int, org_type: type, cells: list, index: int = 0):
+        for x, y in cells[index:index + max(count, 0)]:
+            self.add_organism(self.new_organism(org_type, x, y))
+
+    def new_organism(self, org_type: type, x: int, y: int) -> Organism:
         if org_type == Plant:
-            self.add_organism(Plant(x, y, 100, 0))
+            return Plant(x, y, 100, 0)
         elif org_type == Prey:
-            self.add_organism(Prey(x, y, 100, 0))
+            return Prey(x, y, 100, 0)
         elif org_type == Predator:
-            self.add_organism(Predator(x, y, 100, 0, 0, self.max_cycles // 2))
-        self.add_organisms(count - 1, org_type, cells, index + 1)
+            return Predator(x, y, 100, 0, 0, self.max_cycles // 2)
 
     def get_empty_cells(self, acc: list, x=0, y=0):
+        if self.iterative:
+            return self.get_empty_cells_iterative(acc)
         if x >= self.size:
-            random.shuffle(acc)
+            self.rng.shuffle(acc)
             return acc
         if y >= self.size:
             return self.get_empty_cells(acc, x+1, 0)
@@ -292,6 +326,14 @@ class Ecosystem:
             acc.append((x, y))
         return self.get_empty_cells(acc, x, y+1)
 
+    def get_empty_cells_iterative(self, acc: list):
+        for x, row in enumerate(self.grid):
+            for y, cell in enumerate(row):
+                if cell is None:
+                    acc.append((x, y))
+        self.rng.shuffle(acc)
+        return acc
+
     def add_organism(self, organism: Organism):
         self.grid[organism.x][organism.y] = organism
         self.organisms.append(organism)
@@ -333,6 +375,9 @@ class Ecosystem:
         self.add_organisms(num, Plant, cells)
 
     def update_organisms(self, index: int):
+        if self.iterative:
+            self.update_organisms_iterative(index)
+            return
         if index >= len(self.organisms):
             return
         org = self.organisms[index]
@@ -343,7 +388,19 @@ class Ecosystem:
 
         self.update_organisms(index + 1)
 
+    def update_organisms_iterative(self, index: int):
+        # len() se reevalúa en cada paso igual que en la versión recursiva
+        while index < len(self.organisms):
+            org = self.organisms[index]
+            if org.is_alive():
+                org.update_state(self)
+                org.move(self)
+            index += 1
+
     def print_grid(self, row=0):
+        if self.iterative:
+            self.print_grid_iterative(row)
+            return
         if row >= self.size:
             print(f"Plantas: {self.num_plants} | Presas: {self.num_prey} | Depredadores: {self.num_predators}")
             print(f"Ciclo: {self.cycle_count}/{self.max_cycles}")
@@ -351,6 +408,13 @@ class Ecosystem:
         self.print_row(row, 0)
         self.print_grid(row + 1)
 
+    def print_grid_iterative(self, row=0):
+        for current in range(row, self.size):
+            symbols = [cell.get_symbol() if cell else '🤍' for cell in self.grid[current]]
+            print(' '.join(symbols), end=' \n')
+        print(f"Plantas: {self.num_plants} | Presas: {self.num_prey} | Depredadores: {self.num_predators}")
+        print(f"Ciclo: {self.cycle_count}/{self.max_cycles}")
+
     def print_row(self, row: int, col: int):
         if col >= self.size:
             print()
@@ -366,6 +430,9 @@ class Ecosystem:
                 self.num_prey == 0)
 
     def run_simulation(self):
+        if self.iterative:
+            self.run_simulation_iterative()
+            return
         if self.is_simulation_over():
             return
         self.print_grid()
@@ -374,6 +441,13 @@ class Ecosystem:
         self.update_ecosystem()
         self.run_simulation()
 
+    def run_simulation_iterative(self):
+        while not self.is_simulation_over():
+            self.print_grid()
+            input("Enter para siguiente ciclo...")
+            # sys.stdout.write("\033[F\033[K" * (self.size + 3))
+            self.update_ecosystem()
+
 if __name__ == "__main__":
-    eco = Ecosystem(size=10, max_cycles=30)
+    eco = Ecosystem(size=10, max_cycles=30, iterative="--iterative" in sys.argv)
     eco.run_simulation()
\ No newline at end of file
@@ -4,6 +4,10 @@ from abc import ABC, abstractmethod
 import random
 import sys
 
+# Variante de referencia congelada: Benchmark la mide tal cual (variante 'test') frente
+# al paquete Game_of_life. No usa neighbour_table ni los demás índices a propósito;
+# las optimizaciones van en el paquete, no aquí.
+
 # ======================= Clases Base =======================
 @dataclass
 class Organism(ABC):